@@ -8,81 +8,187 @@ Version: 3.0.0
 
 import sys
 import os
+import re
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
 import math
+import time
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from modules.speech_recognition_module import SpeechRecognizer
-from modules.text_to_speech_module import TextToSpeech
-from modules.nlp_processor import IntentProcessor
-from modules.response_generator import ResponseGenerator
+
+# Interim transcripts repeated this many times are processed speculatively
+PREFETCH_STABLE_UPDATES = 2
+
+GOODBYE_MESSAGE = "Goodbye! Have a great day! 👋"
+
+WELCOME_BANNER = """Welcome to Campus Voice Assistant! 🎓
+
+I'm here to help you with:
+  ✨ Class schedules and timetables
+  ✨ Exam dates and information
+  ✨ Department details and contacts
+  ✨ Campus facilities info
+  ✨ Events and activities
+
+👉 Click the microphone or type below to get started!"""
+
+# Questions that can wait for an answer before new ones are refused
+_QUERY_QUEUE_SIZE = 4
+
+# Maximum number of lines kept in the chat display, checked every _TRIM_EVERY messages
+_MAX_LINES = 500
+_TRIM_EVERY = 10
+
+# Splits a query into words for command checks
+_WORD_RE = re.compile(r"\w+")
+
+# Last sentence-ending punctuation in a string
+_LAST_SENTENCE_END_RE = re.compile(r'[.!?](?=[^.!?]*$)')
+
+
+def _truncate_for_tts(text, limit=400):
+    """Shorten text for speech, cutting at the last sentence end within limit"""
+    if len(text) <= limit:
+        return text
+    head = text[:limit]
+    match = _LAST_SENTENCE_END_RE.search(head)
+    return head[:match.end()] if match else head
 
 
 class TTSManager:
     """Thread-safe TTS manager to prevent run loop errors"""
-    def __init__(self):
+    TICK = 0.02  # seconds between engine iterations
+    
+    def __init__(self, precompute=()):
         self.queue = queue.Queue()
         self.tts = None
         self.running = True
+        self.precompute = list(precompute)
+        self._interrupt = threading.Event()
         self.thread = threading.Thread(target=self._worker, daemon=True)
         self.thread.start()
     
     def _worker(self):
         """Worker thread for TTS"""
-        import pyttsx3
-        self.tts = pyttsx3.init()
-        self.tts.setProperty('rate', 150)
-        self.tts.setProperty('volume', 0.9)
-        
-        while self.running:
+        from modules.text_to_speech_module import TextToSpeech
+        self.tts = TextToSpeech(rate=150, volume=0.9)
+        # Cached clips only help when they can be played; they are rendered
+        # one at a time while idle, so a queued reply always goes first
+        pending = list(self.precompute) if self.tts.playback_available else []
+        render = None
+        
+        # Drive the engine loop ourselves so the queue and interrupts are
+        # checked between ticks instead of after a whole utterance
+        engine = self.tts.engine
+        engine.startLoop(False)
+        playing_until = 0.0  # When a cached clip started below ends
+        try:
+            while self.running:
+                if self._handle_interrupt():
+                    playing_until = 0.0
+                engine.iterate()
+                if engine.isBusy() or time.monotonic() < playing_until:
+                    time.sleep(self.TICK)
+                    continue
+                if render is not None:
+                    self.tts.finish_render(render)
+                    render = None
+                
+                combined = self._next_text()
+                if not combined:
+                    while pending and render is None:
+                        phrase = pending.pop(0)
+                        if not self.tts.is_cached(phrase):
+                            render = self.tts.start_render(phrase)
+                    continue
+                # The text may have been queued by an interrupt that arrived
+                # while waiting; stop now rather than cutting the new text off
+                self._handle_interrupt()
+                try:
+                    # Cached clips play in the background so interrupts still
+                    # get through; everything else goes to the engine loop
+                    duration = None
+                    if self.tts.playback_available and self.tts.is_cached(combined):
+                        duration = self.tts.play_cached_nowait(combined)
+                    if duration is None:
+                        engine.say(combined)
+                    else:
+                        playing_until = time.monotonic() + duration
+                except Exception as e:
+                    print(f"❌ Speech error: {e}")
+        finally:
+            engine.endLoop()
+    
+    def _handle_interrupt(self):
+        """
+        Stop whatever is being spoken if an interrupt was requested
+        
+        Returns:
+            True if speech was stopped
+        """
+        if not self._interrupt.is_set():
+            return False
+        self._interrupt.clear()
+        self.tts.stop()
+        return True
+    
+    def _next_text(self):
+        """
+        Wait briefly for queued text and join everything that piled up
+        
+        Returns:
+            Text to speak in a single engine run, or an empty string
+        """
+        try:
+            texts = [self.queue.get(timeout=self.TICK)]
+        except queue.Empty:
+            return ''
+        while True:
             try:
-                text = self.queue.get(timeout=0.5)
-                if text:
-                    self.tts.say(text)
-                    self.tts.runAndWait()
+                texts.append(self.queue.get_nowait())
             except queue.Empty:
-                continue
-            except Exception:
-                pass
+                break
+        return ' '.join(_truncate_for_tts(text) for text in texts if text)
+    
+    def speak(self, text, interrupt=False):
+        """
+        Add text to speak queue
+        
+        Args:
+            text: Text string to speak
+            interrupt: If True, replace anything queued or being spoken
+        """
+        if not text:
+            return
+        if interrupt:
+            self.interrupt()
+        self.queue.put(text)
     
-    def speak(self, text):
-        """Add text to speak queue"""
-        if text:
-            self.queue.put(text)
+    def flush(self):
+        """Drop any responses that are still waiting to be spoken"""
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                break
+    
+    def interrupt(self):
+        """Drop queued responses and cut off the one being spoken"""
+        self.flush()
+        self._interrupt.set()
     
     def stop(self):
         self.running = False
 
 
-class AnimatedGradientCanvas(tk.Canvas):
-    """Animated gradient background"""
-    def __init__(self, parent, colors, **kwargs):
-        super().__init__(parent, highlightthickness=0, **kwargs)
-        self.colors = colors
-        self.offset = 0
-        self.bind("<Configure>", self._draw_gradient)
-    
-    def _draw_gradient(self, event=None):
-        self.delete("gradient")
-        width = self.winfo_width()
-        height = self.winfo_height()
-        for i in range(height):
-            ratio = i / height
-            r = int(self.colors[0][0] + (self.colors[1][0] - self.colors[0][0]) * ratio)
-            g = int(self.colors[0][1] + (self.colors[1][1] - self.colors[0][1]) * ratio)
-            b = int(self.colors[0][2] + (self.colors[1][2] - self.colors[0][2]) * ratio)
-            color = f'#{r:02x}{g:02x}{b:02x}'
-            self.create_line(0, i, width, i, fill=color, tags="gradient")
-
-
 class PulsingButton(tk.Canvas):
-    """Animated pulsing microphone button"""
+    """Animated pulsing microphone button (the owner drives the animation via tick())"""
     def __init__(self, parent, command, size=120, **kwargs):
         super().__init__(parent, width=size+40, height=size+40, 
                         highlightthickness=0, bg=parent["bg"], **kwargs)
@@ -94,24 +200,22 @@ class PulsingButton(tk.Canvas):
         self.listening_color = "#ef4444"
         self.current_color = self.base_color
         
-        self._draw()
+        self._create_items()
         self.bind("<Button-1>", self._on_click)
         self.bind("<Enter>", self._on_enter)
         self.bind("<Leave>", self._on_leave)
-        self._animate()
     
-    def _draw(self):
-        self.delete("all")
+    def _create_items(self):
+        """Create the canvas items once; later updates only reconfigure them"""
         cx, cy = (self.size + 40) // 2, (self.size + 40) // 2
+        self._center = cx
         
-        # Outer glow/pulse
-        if self.is_listening:
-            for i in range(3):
-                alpha = 0.3 - (i * 0.1)
-                pulse_r = self.size // 2 + 10 + self.pulse_size + (i * 8)
-                glow_color = "#fca5a5" if self.is_listening else "#a5b4fc"
-                self.create_oval(cx - pulse_r, cy - pulse_r, cx + pulse_r, cy + pulse_r,
-                               fill="", outline=glow_color, width=2, tags="pulse")
+        # Outer glow/pulse, shown only while listening
+        self._pulse_ids = [
+            self.create_oval(cx, cy, cx, cy, fill="", outline="#fca5a5", width=2,
+                             state='hidden', tags="pulse")
+            for _ in range(3)
+        ]
         
         # Shadow
         self.create_oval(cx - self.size//2 + 4, cy - self.size//2 + 4,
@@ -119,9 +223,9 @@ class PulsingButton(tk.Canvas):
                         fill="#1e1b4b", outline="")
         
         # Main button
-        self.create_oval(cx - self.size//2, cy - self.size//2,
-                        cx + self.size//2, cy + self.size//2,
-                        fill=self.current_color, outline="")
+        self._main_id = self.create_oval(cx - self.size//2, cy - self.size//2,
+                                         cx + self.size//2, cy + self.size//2,
+                                         fill=self.current_color, outline="")
         
         # Inner highlight
         self.create_oval(cx - self.size//2 + 8, cy - self.size//2 + 8,
@@ -129,20 +233,24 @@ class PulsingButton(tk.Canvas):
                         fill="", outline="#ffffff", width=2)
         
         # Microphone icon
-        icon = "🎤" if not self.is_listening else "🔴"
-        self.create_text(cx, cy, text=icon, font=("Segoe UI Emoji", 36),
-                        fill="white", tags="icon")
+        self._icon_id = self.create_text(cx, cy, text="🎤", font=("Segoe UI Emoji", 36),
+                                         fill="white", tags="icon")
         
         # Status text
-        status = "TAP TO SPEAK" if not self.is_listening else "LISTENING..."
-        self.create_text(cx, cy + self.size//2 + 25, text=status,
-                        font=("Segoe UI", 10, "bold"), fill="#94a3b8")
+        self._status_id = self.create_text(cx, cy + self.size//2 + 25, text="TAP TO SPEAK",
+                                           font=("Segoe UI", 10, "bold"), fill="#94a3b8")
     
-    def _animate(self):
-        if self.is_listening:
-            self.pulse_size = (self.pulse_size + 2) % 20
-            self._draw()
-        self.after(50, self._animate)
+    def _update_pulse(self):
+        """Move the pulse rings to the current pulse size"""
+        c = self._center
+        for i, ring in enumerate(self._pulse_ids):
+            pulse_r = self.size // 2 + 10 + self.pulse_size + (i * 8)
+            self.coords(ring, c - pulse_r, c - pulse_r, c + pulse_r, c + pulse_r)
+    
+    def tick(self):
+        """Advance the pulse animation by one frame"""
+        self.pulse_size = (self.pulse_size + 2) % 20
+        self._update_pulse()
     
     def _on_click(self, event):
         if self.command:
@@ -158,7 +266,12 @@ class PulsingButton(tk.Canvas):
         self.is_listening = listening
         self.current_color = self.listening_color if listening else self.base_color
         self.pulse_size = 0
-        self._draw()
+        self.itemconfig(self._main_id, fill=self.current_color)
+        self.itemconfig(self._icon_id, text="🔴" if listening else "🎤")
+        self.itemconfig(self._status_id, text="LISTENING..." if listening else "TAP TO SPEAK")
+        for ring in self._pulse_ids:
+            self.itemconfig(ring, state='normal' if listening else 'hidden')
+        self._update_pulse()
 
 
 class GlassCard(tk.Frame):
@@ -172,8 +285,6 @@ class CampusAssistantGUI:
     """Premium Modern GUI for Campus Voice Assistant"""
     
     COLORS = {
-        'bg_gradient_start': (15, 23, 42),
-        'bg_gradient_end': (30, 27, 75),
         'card_bg': '#1e1b4b',
         'card_bg_light': '#312e81',
         'primary': '#6366f1',
@@ -190,6 +301,31 @@ class CampusAssistantGUI:
         'text_dark': '#64748b',
     }
     
+    # Chat display text tags
+    _TAGS = (
+        ('user', {'foreground': '#818cf8', 'font': ("Segoe UI", 11, "bold")}),
+        ('bot', {'foreground': '#22d3ee', 'font': ("Segoe UI", 11, "bold")}),
+        ('msg', {'foreground': '#e2e8f0'}),
+        ('time', {'foreground': '#64748b', 'font': ("Segoe UI", 9)}),
+        ('system', {'foreground': '#f59e0b', 'font': ("Segoe UI", 10, "italic")}),
+        ('error', {'foreground': '#ef4444'}),
+    )
+    
+    # Whole words that close the app, so "goodbye" matches but "exited" does not
+    _EXIT_WORDS = frozenset({'exit', 'quit', 'bye', 'goodbye'})
+    
+    # Header and tag for senders shown with a name and timestamp
+    _SENDER_PREFIX = {
+        'user': ("\n👤 You ", 'user'),
+        'bot': ("\n🤖 Assistant ", 'bot'),
+    }
+    
+    # Prefix and tag for senders shown as a single notice line
+    _NOTICE_PREFIX = {
+        'error': ("\n⚠️ ", 'error'),
+        'system': ("\n", 'system'),
+    }
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("🎓 Campus Voice Assistant")
@@ -202,13 +338,37 @@ class CampusAssistantGUI:
         # Initialize components
         self.speech_recognizer = None
         self.tts_manager = None
-        self.nlp_processor = IntentProcessor()
-        self.response_generator = ResponseGenerator()
+        # Built on the init thread so the window paints straight away
+        self.nlp_processor = None
+        self.response_generator = None
+        self._nlp_ready = threading.Event()
         
         self.is_listening = False
+        self._cancel_event = threading.Event()
         self.voice_enabled = True
         
+        # Chat messages waiting for the next idle flush
+        self._pending_messages = []
+        self._pending_lock = threading.Lock()
+        self._messages_since_trim = 0
+        self._cached_minute = None
+        self._cached_time_str = ''
+        
+        # Shared pool for background work (init, listening, prefetch)
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='assistant')
+        
+        # Queries are answered in order by one long-lived worker. Together with the
+        # mic thread and the TTS worker this forms a STT -> NLP -> TTS pipeline,
+        # bounded so a backlog of questions can't build up unnoticed.
+        self._query_q = queue.Queue(maxsize=_QUERY_QUEUE_SIZE)
+        threading.Thread(target=self._query_worker, daemon=True).start()
+        
+        # Responses computed from stable interim transcripts, keyed by processed text
+        self._prefetch_cache = {}
+        self._prefetch_lock = threading.Lock()
+        
         self._create_ui()
+        self._start_tickers()
         self._initialize_components()
         self._show_welcome()
         
@@ -225,6 +385,8 @@ class CampusAssistantGUI:
         main = tk.Frame(self.root, bg='#0f172a')
         main.pack(fill=tk.BOTH, expand=True)
         
+        self._create_styles()
+        
         # Left panel - Quick Actions
         self._create_left_panel(main)
         
@@ -234,6 +396,19 @@ class CampusAssistantGUI:
         # Right panel - Voice Control
         self._create_right_panel(main)
     
+    def _create_styles(self):
+        """Configure the shared ttk styles used by the side panels"""
+        style = ttk.Style(self.root)
+        # 'clam' honours custom button colors on every platform
+        style.theme_use('clam')
+        style.configure('QuickAction.TButton', background='#1e1b4b', foreground='#e2e8f0',
+                        bordercolor='#1e1b4b', lightcolor='#1e1b4b', darkcolor='#1e1b4b',
+                        focuscolor='#1e1b4b', font=("Segoe UI", 11), anchor='w', padding=8)
+        style.map('QuickAction.TButton',
+                  background=[('active', '#312e81')],
+                  lightcolor=[('active', '#312e81')],
+                  darkcolor=[('active', '#312e81')])
+    
     def _create_left_panel(self, parent):
         """Create left sidebar with quick actions"""
         left = tk.Frame(parent, bg='#1e1b4b', width=250)
@@ -260,18 +435,21 @@ class CampusAssistantGUI:
         
         # Quick action buttons
         actions = [
-            ("📅", "Today's Classes", "What are today's classes?", "#6366f1"),
-            ("📝", "Exam Schedule", "What is the exam schedule?", "#8b5cf6"),
-            ("🏛️", "Departments", "Tell me about departments", "#06b6d4"),
-            ("📚", "Library", "Library timings", "#10b981"),
-            ("🏥", "Medical", "Medical center info", "#f59e0b"),
-            ("🎉", "Events", "Upcoming events", "#ec4899"),
-            ("🍽️", "Canteen", "Canteen information", "#14b8a6"),
-            ("🚌", "Transport", "Bus information", "#f97316"),
+            ("📅", "Today's Classes", "What are today's classes?"),
+            ("📝", "Exam Schedule", "What is the exam schedule?"),
+            ("🏛️", "Departments", "Tell me about departments"),
+            ("📚", "Library", "Library timings"),
+            ("🏥", "Medical", "Medical center info"),
+            ("🎉", "Events", "Upcoming events"),
+            ("🍽️", "Canteen", "Canteen information"),
+            ("🚌", "Transport", "Bus information"),
         ]
         
-        for emoji, label, query, color in actions:
-            self._create_quick_action(left, emoji, label, query, color)
+        # One themed widget per row; hover colors come from the style map
+        for emoji, label, query in actions:
+            ttk.Button(left, text=f"{emoji}  {label}", style='QuickAction.TButton',
+                       cursor='hand2',
+                       command=lambda q=query: self._quick_query(q)).pack(fill=tk.X, padx=15, pady=3)
         
         # Spacer
         tk.Frame(left, bg='#1e1b4b').pack(fill=tk.BOTH, expand=True)
@@ -291,28 +469,6 @@ class CampusAssistantGUI:
                                     font=("Segoe UI", 10), bg='#312e81', fg='#94a3b8')
         self.status_text.pack(side=tk.LEFT, padx=(8, 0))
     
-    def _create_quick_action(self, parent, emoji, label, query, color):
-        """Create a quick action button"""
-        btn = tk.Frame(parent, bg='#1e1b4b', cursor='hand2')
-        btn.pack(fill=tk.X, padx=15, pady=3)
-        
-        inner = tk.Frame(btn, bg='#1e1b4b')
-        inner.pack(fill=tk.X, padx=10, pady=8)
-        
-        tk.Label(inner, text=emoji, font=("Segoe UI Emoji", 16),
-                bg='#1e1b4b', fg=color).pack(side=tk.LEFT)
-        tk.Label(inner, text=label, font=("Segoe UI", 11),
-                bg='#1e1b4b', fg='#e2e8f0').pack(side=tk.LEFT, padx=(10, 0))
-        
-        for widget in [btn, inner] + list(inner.children.values()):
-            widget.bind("<Enter>", lambda e, b=btn: b.configure(bg='#312e81') or 
-                       [w.configure(bg='#312e81') for w in [b] + list(b.children.values()) + 
-                        list(list(b.children.values())[0].children.values()) if hasattr(w, 'configure')])
-            widget.bind("<Leave>", lambda e, b=btn: b.configure(bg='#1e1b4b') or
-                       [w.configure(bg='#1e1b4b') for w in [b] + list(b.children.values()) +
-                        list(list(b.children.values())[0].children.values()) if hasattr(w, 'configure')])
-            widget.bind("<Button-1>", lambda e, q=query: self._quick_query(q))
-    
     def _create_center_panel(self, parent):
         """Create center chat panel"""
         center = tk.Frame(parent, bg='#0f172a')
@@ -329,7 +485,7 @@ class CampusAssistantGUI:
         self.time_label = tk.Label(header, text="", font=("Segoe UI", 11),
                                    bg='#0f172a', fg='#64748b')
         self.time_label.pack(side=tk.RIGHT, pady=10)
-        self._update_time()
+        self._time_text = None
         
         # Chat container
         chat_container = tk.Frame(center, bg='#1e1b4b')
@@ -358,23 +514,25 @@ class CampusAssistantGUI:
         
         self.chat_display = tk.Text(
             chat_frame, wrap=tk.WORD, font=("Segoe UI", 11),
-            bg='#312e81', fg='#e2e8f0', insertbackground='white',
-            state=tk.DISABLED, padx=20, pady=15, relief=tk.FLAT,
+            bg='#312e81', fg='#e2e8f0', insertbackground='white', insertwidth=0,
+            padx=20, pady=15, relief=tk.FLAT,
             spacing1=8, spacing3=8, selectbackground='#6366f1'
         )
         self.chat_display.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
+        # Stay editable for our own inserts but swallow user edits;
+        # selection and Ctrl+C still work
+        self.chat_display.bind('<Key>', self._block_chat_edit)
+        for seq in ('<Button-2>', '<<Paste>>', '<<Cut>>', '<<Clear>>'):
+            self.chat_display.bind(seq, lambda e: 'break')
+        
         scrollbar = tk.Scrollbar(chat_frame, command=self.chat_display.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.chat_display.config(yscrollcommand=scrollbar.set)
         
         # Text tags
-        self.chat_display.tag_configure('user', foreground='#818cf8', font=("Segoe UI", 11, "bold"))
-        self.chat_display.tag_configure('bot', foreground='#22d3ee', font=("Segoe UI", 11, "bold"))
-        self.chat_display.tag_configure('msg', foreground='#e2e8f0')
-        self.chat_display.tag_configure('time', foreground='#64748b', font=("Segoe UI", 9))
-        self.chat_display.tag_configure('system', foreground='#f59e0b', font=("Segoe UI", 10, "italic"))
-        self.chat_display.tag_configure('error', foreground='#ef4444')
+        for tag, options in self._TAGS:
+            self.chat_display.tag_configure(tag, **options)
         
         # Input area
         input_frame = tk.Frame(center, bg='#1e1b4b')
@@ -415,7 +573,14 @@ class CampusAssistantGUI:
         
         # Pulsing microphone button
         self.mic_button = PulsingButton(right, command=self._on_voice_click, size=100)
-        self.mic_button.pack(pady=20)
+        self.mic_button.pack(pady=(20, 5))
+        
+        cancel_btn = tk.Label(right, text="✖ Cancel", font=("Segoe UI", 9),
+                              bg='#312e81', fg='#94a3b8', cursor='hand2', padx=12, pady=4)
+        cancel_btn.pack(pady=(0, 10))
+        cancel_btn.bind("<Button-1>", lambda e: self._cancel_listening())
+        cancel_btn.bind("<Enter>", lambda e: cancel_btn.configure(fg='#ffffff', bg='#ef4444'))
+        cancel_btn.bind("<Leave>", lambda e: cancel_btn.configure(fg='#94a3b8', bg='#312e81'))
         
         # Voice toggle
         toggle_frame = tk.Frame(right, bg='#1e1b4b')
@@ -471,9 +636,50 @@ class CampusAssistantGUI:
         else:
             return "Good Evening! 🌙"
     
-    def _update_time(self):
-        self.time_label.config(text=datetime.now().strftime("%I:%M %p  •  %B %d, %Y"))
-        self.root.after(1000, self._update_time)
+    def _start_tickers(self):
+        """Set up the periodic UI work, all driven from one Tk timer"""
+        self._tickers = [
+            {'interval': 1.0, 'callback': self._update_time_tick, 'active': lambda: True},
+            {'interval': 0.05, 'callback': self.mic_button.tick,
+             'active': lambda: self.mic_button.is_listening},
+        ]
+        now = time.monotonic()
+        for ticker in self._tickers:
+            ticker['due'] = now
+        self._tick_id = None
+        self._master_tick()
+    
+    def _master_tick(self):
+        """Run every periodic task that is due, then sleep until the next one"""
+        now = time.monotonic()
+        next_due = None
+        for ticker in self._tickers:
+            if not ticker['active']():
+                ticker['due'] = now  # Run as soon as it becomes active
+                continue
+            if now >= ticker['due']:
+                ticker['callback']()
+                ticker['due'] = now + ticker['interval']
+            next_due = ticker['due'] if next_due is None else min(next_due, ticker['due'])
+        delay = max(1, int((next_due - now) * 1000))
+        self._tick_id = self.root.after(delay, self._master_tick)
+    
+    def _wake_tickers(self):
+        """Re-run the ticker now, e.g. when an animation becomes active"""
+        if self._tick_id:
+            self.root.after_cancel(self._tick_id)
+        self._master_tick()
+    
+    def _set_listening(self, listening):
+        self.mic_button.set_listening(listening)
+        self._wake_tickers()
+    
+    def _update_time_tick(self):
+        # The clock shows minutes, so the label only needs updating when that changes
+        text = datetime.now().strftime("%I:%M %p  •  %B %d, %Y")
+        if text != self._time_text:
+            self._time_text = text
+            self.time_label.config(text=text)
     
     def _on_focus_in(self, event):
         if self.input_var.get() == "Type your question here...":
@@ -494,130 +700,299 @@ class CampusAssistantGUI:
             self.voice_icon.config(fg='#64748b')
             self.voice_status.config(text="OFF", fg='#64748b')
     
+    def _ready_for_queries(self):
+        """Check that the NLP components have loaded, telling the user if not"""
+        if not self._nlp_ready.is_set():
+            self._add_message("system", "Still loading...")
+            return False
+        return True
+    
     def _quick_query(self, query):
+        if not self._ready_for_queries():
+            return
+        self._interrupt_speech()
         self._add_message("user", query)
-        threading.Thread(target=self._process, args=(query,), daemon=True).start()
+        self._enqueue_query(query)
     
     def _initialize_components(self):
         def init():
+            self._set_status("Initializing...", "warning")
+            # Heavy audio/NLP modules are imported here so the window appears first.
+            # Mic enumeration and TTS engine start-up are independent, so overlap them.
+            from modules.speech_recognition_module import SpeechRecognizer
+            recognizer_future = self._executor.submit(SpeechRecognizer)
+            
             try:
-                self._set_status("Initializing...", "warning")
-                self.speech_recognizer = SpeechRecognizer()
-                self.tts_manager = TTSManager()
+                from modules.nlp_processor import IntentProcessor
+                from modules.response_generator import ResponseGenerator
+                self.nlp_processor = IntentProcessor()
+                self.response_generator = ResponseGenerator()
+                # Compile the NLP patterns now rather than on the first real query
+                self.nlp_processor.process_query("warmup")
+            except Exception as e:
+                self._add_message("error", f"Init error: {e}")
+            finally:
+                self._nlp_ready.set()
+            
+            try:
+                phrases = [GOODBYE_MESSAGE]
+                if self.response_generator:
+                    phrases += self.response_generator.greetings + self.response_generator.unknown_responses
+                self.tts_manager = TTSManager(precompute=phrases)
+            except Exception as e:
+                self._add_message("error", f"Voice output error: {e}")
+            
+            try:
+                self.speech_recognizer = recognizer_future.result()
                 self._set_status("Ready", "success")
             except Exception as e:
                 self._add_message("error", f"Init error: {e}")
                 self._set_status("Text Mode", "warning")
         
-        threading.Thread(target=init, daemon=True).start()
+        self._executor.submit(init)
     
     def _show_welcome(self):
-        welcome = """Welcome to Campus Voice Assistant! 🎓
-
-I'm here to help you with:
-  ✨ Class schedules and timetables
-  ✨ Exam dates and information
-  ✨ Department details and contacts
-  ✨ Campus facilities info
-  ✨ Events and activities
-
-👉 Click the microphone or type below to get started!"""
-        self._add_message("bot", welcome)
+        self._add_message("bot", WELCOME_BANNER)
     
     def _add_message(self, sender, message):
-        self.chat_display.config(state=tk.NORMAL)
-        time_str = datetime.now().strftime("%I:%M %p")
-        
-        if sender == "user":
-            self.chat_display.insert(tk.END, f"\n👤 You ", 'user')
-            self.chat_display.insert(tk.END, f"  {time_str}\n", 'time')
-            self.chat_display.insert(tk.END, f"{message}\n", 'msg')
-        elif sender == "bot":
-            self.chat_display.insert(tk.END, f"\n🤖 Assistant ", 'bot')
-            self.chat_display.insert(tk.END, f"  {time_str}\n", 'time')
-            self.chat_display.insert(tk.END, f"{message}\n", 'msg')
-        elif sender == "error":
-            self.chat_display.insert(tk.END, f"\n⚠️ {message}\n", 'error')
-        elif sender == "system":
-            self.chat_display.insert(tk.END, f"\n{message}\n", 'system')
-        
-        self.chat_display.config(state=tk.DISABLED)
+        """Queue a message for the chat; safe to call from any thread"""
+        with self._pending_lock:
+            self._pending_messages.append((sender, message))
+            if len(self._pending_messages) > 1:
+                return  # A flush is already scheduled
+        self.root.after_idle(self._flush_messages)
+    
+    def _message_time(self):
+        """Get the message timestamp, formatted at most once per minute"""
+        now = datetime.now()
+        minute = (now.hour, now.minute)
+        if minute != self._cached_minute:
+            self._cached_minute = minute
+            self._cached_time_str = now.strftime("%I:%M %p")
+        return self._cached_time_str
+    
+    def _flush_messages(self):
+        """Write every queued message in a single widget update"""
+        with self._pending_lock:
+            messages, self._pending_messages = self._pending_messages, []
+        
+        time_segment = f"  {self._message_time()}\n"
+        
+        for sender, message in messages:
+            header = self._SENDER_PREFIX.get(sender)
+            if header:
+                self.chat_display.insert(tk.END, header[0], header[1], time_segment, 'time',
+                                         f"{message}\n", 'msg')
+                continue
+            notice = self._NOTICE_PREFIX.get(sender)
+            if notice:
+                self.chat_display.insert(tk.END, f"{notice[0]}{message}\n", notice[1])
+        
+        # Drop the oldest lines so the widget doesn't grow for the whole session;
+        # checked every few messages since a single message adds only a few lines
+        self._messages_since_trim += len(messages)
+        if self._messages_since_trim >= _TRIM_EVERY:
+            self._messages_since_trim = 0
+            line_count = int(self.chat_display.index('end-1c').split('.')[0])
+            if line_count > _MAX_LINES:
+                self.chat_display.delete('1.0', f'{line_count - _MAX_LINES}.0')
+        
         self.chat_display.see(tk.END)
     
     def _set_status(self, text, state="normal"):
+        """Update the status indicator; safe to call from any thread"""
+        self.root.after(0, self._apply_status, text, state)
+    
+    def _apply_status(self, text, state):
         self.status_text.config(text=text)
         colors = {"success": "#10b981", "warning": "#f59e0b", "error": "#ef4444", "normal": "#94a3b8"}
         self.status_dot.config(fg=colors.get(state, "#94a3b8"))
     
+    def _interrupt_speech(self):
+        """Stop queued speech when the user starts a new turn"""
+        if self.tts_manager:
+            self.tts_manager.interrupt()
+    
     def _on_voice_click(self):
         if self.is_listening:
             return
+        self._interrupt_speech()
         if not self.speech_recognizer or not self.speech_recognizer.microphone_available:
             self._add_message("error", "Microphone not available. Please type instead.")
             return
-        threading.Thread(target=self._listen, daemon=True).start()
+        self._cancel_event.clear()
+        self._executor.submit(self._listen)
+    
+    def _cancel_listening(self):
+        """Stop the current capture without sending anything"""
+        if not self.is_listening or self._cancel_event.is_set():
+            return
+        self._cancel_event.set()
+        self._add_message("system", "Listening cancelled.")
     
     def _listen(self):
+        """Feed microphone chunks to the speech detector until it hears an endpoint"""
         self.is_listening = True
-        self.mic_button.set_listening(True)
+        self.root.after(0, self._set_listening, True)
         self._set_status("Listening...", "warning")
         
+        with self._prefetch_lock:
+            self._prefetch_cache.clear()
+        
+        audio_q = queue.Queue()
+        endpoint = threading.Event()
+        self._executor.submit(self._detect_speech, audio_q, endpoint)
+        try:
+            for chunk in self.speech_recognizer.stream_chunks():
+                audio_q.put(chunk)
+                if self._cancel_event.is_set() or endpoint.is_set():
+                    break
+        except Exception as e:
+            self._cancel_event.set()
+            self._add_message("error", f"Error: {e}")
+        finally:
+            audio_q.put(None)
+    
+    def _detect_speech(self, audio_q, endpoint):
+        """Decode queued audio, stopping capture once the speaker goes quiet"""
         try:
-            text = self.speech_recognizer.get_text_from_speech()
+            text = None
+            last_partial, stable = None, 0
+            for text, is_final in self.speech_recognizer.stream_text(
+                    chunks=iter(audio_q.get, None), cancel=self._cancel_event):
+                if is_final:
+                    break
+                if text == last_partial:
+                    stable += 1
+                    if stable == PREFETCH_STABLE_UPDATES:
+                        self._executor.submit(self._prefetch_response, text)
+                    continue
+                last_partial, stable = text, 1
+                self.root.after(0, self._show_partial, text)
+                self._set_status("Hearing...", "warning")
+            endpoint.set()
+            self.root.after(0, self._clear_partial)
+            if self._cancel_event.is_set():
+                return
             if text:
                 self._add_message("user", text)
-                self._process(text)
+                self._enqueue_query(text)
             else:
                 self._add_message("error", "Couldn't understand. Please try again.")
         except Exception as e:
             self._add_message("error", f"Error: {e}")
         finally:
+            endpoint.set()
             self.is_listening = False
-            self.mic_button.set_listening(False)
+            self.root.after(0, self._set_listening, False)
             self._set_status("Ready", "success")
     
+    def _show_partial(self, text):
+        """Show the interim transcript, replacing any previous one"""
+        if self.chat_display.tag_ranges('partial'):
+            self.chat_display.delete('partial.first', 'partial.last')
+        self.chat_display.insert(tk.END, f"\n🎤 {text}...\n", ('system', 'partial'))
+        self.chat_display.see(tk.END)
+    
+    def _clear_partial(self):
+        """Remove the interim transcript once the final one is known"""
+        if self.chat_display.tag_ranges('partial'):
+            self.chat_display.delete('partial.first', 'partial.last')
+    
+    def _block_chat_edit(self, event):
+        """Ignore typing in the chat log while keeping copy and navigation keys"""
+        if event.state & 0x4 and event.keysym.lower() in ('c', 'a'):
+            return None
+        if event.keysym in ('Left', 'Right', 'Up', 'Down', 'Prior', 'Next', 'Home', 'End'):
+            return None
+        return 'break'
+    
     def _on_submit(self, event=None):
         text = self.input_var.get().strip()
         if not text or text == "Type your question here...":
             return
+        if not self._ready_for_queries():
+            return
         self.input_entry.delete(0, tk.END)
+        self._interrupt_speech()
         self._add_message("user", text)
-        threading.Thread(target=self._process, args=(text,), daemon=True).start()
+        self._enqueue_query(text)
+    
+    def _enqueue_query(self, query):
+        """Hand a query to the query worker without blocking the caller"""
+        try:
+            self._query_q.put_nowait(query)
+        except queue.Full:
+            self._add_message("error", "Still working on earlier questions. Please wait a moment.")
+    
+    def _query_worker(self):
+        """Answer queued queries one at a time until a None sentinel arrives"""
+        while True:
+            query = self._query_q.get()
+            if query is None:
+                break
+            self._process(query)
     
     def _process(self, query):
         self._set_status("Processing...", "warning")
         try:
-            if any(w in query.lower() for w in ['exit', 'quit', 'bye']):
-                response = "Goodbye! Have a great day! 👋"
+            if not self._EXIT_WORDS.isdisjoint(_WORD_RE.findall(query.lower())):
+                response = GOODBYE_MESSAGE
                 self._add_message("bot", response)
                 if self.voice_enabled and self.tts_manager:
-                    self.tts_manager.speak(response)
+                    self.tts_manager.speak(response, interrupt=True)
                 self.root.after(2000, self.root.quit)
                 return
             
-            result = self.nlp_processor.process_query(query)
-            response = self.response_generator.generate_response(result)
+            if self.response_generator is None:
+                self._add_message("error", "Assistant failed to load. Please restart.")
+                return
+            
+            with self._prefetch_lock:
+                response = self._prefetch_cache.pop(self.nlp_processor.preprocess_text(query), None)
+            if response is None:
+                result = self.nlp_processor.process_query(query)
+                response = self.response_generator.generate_response(result)
             self._add_message("bot", response)
             
             if self.voice_enabled and self.tts_manager:
-                self.tts_manager.speak(response[:400] if len(response) > 400 else response)
+                self.tts_manager.speak(response, interrupt=True)
         except Exception as e:
             self._add_message("error", f"Error: {e}")
         finally:
             self._set_status("Ready", "success")
     
+    def _prefetch_response(self, partial):
+        """Speculatively compute the response for a stable interim transcript"""
+        key = self.nlp_processor.preprocess_text(partial)
+        with self._prefetch_lock:
+            if key in self._prefetch_cache:
+                return
+        try:
+            result = self.nlp_processor.process_query(partial)
+            response = self.response_generator.generate_response(result)
+        except Exception:
+            return
+        with self._prefetch_lock:
+            self._prefetch_cache[key] = response
+    
     def _show_help(self):
+        if not self._ready_for_queries() or self.response_generator is None:
+            return
         self._add_message("bot", self.response_generator.get_help_message())
     
     def _clear_chat(self):
-        self.chat_display.config(state=tk.NORMAL)
         self.chat_display.delete(1.0, tk.END)
-        self.chat_display.config(state=tk.DISABLED)
         self._show_welcome()
     
     def _on_close(self):
         if self.tts_manager:
             self.tts_manager.stop()
+        try:
+            self._query_q.put_nowait(None)
+        except queue.Full:
+            pass  # The worker is a daemon thread and exits with the app
+        self._executor.shutdown(wait=False)
         self.root.destroy()
     
     def run(self):
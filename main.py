@@ -11,15 +11,71 @@ Version: 1.0.0
 
 import sys
 import os
+import re
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from modules.speech_recognition_module import SpeechRecognizer
-from modules.text_to_speech_module import TextToSpeech
+from modules.text_to_speech_module import TextToSpeech, split_sentences
 from modules.nlp_processor import IntentProcessor
 from modules.response_generator import ResponseGenerator
 
+WELCOME_SPEECH = "Welcome to the Voice-Controlled Campus Assistant! How can I help you today?"
+GOODBYE_SPEECH = "Goodbye! Have a great day!"
+
+# Help commands must be the whole query; an exit word anywhere ends the session
+_CMD_RE = re.compile(r'^\s*(help|commands|what can you do)\s*$'
+                     r'|\b(exit|quit|bye|goodbye|stop|end)\b', re.IGNORECASE)
+
+
+async def _in_daemon_thread(func):
+    """
+    Like asyncio.to_thread, but the worker thread never holds up exit
+    
+    Used for blocking input so Ctrl+C can end the app mid-prompt.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def resolve(result, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def worker():
+        try:
+            result, error = func(), None
+        except Exception as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(resolve, result, error)
+        except RuntimeError:
+            pass  # Event loop already closed
+    
+    threading.Thread(target=worker, daemon=True).start()
+    return await future
+
+
+def match_command(query):
+    """
+    Classify built-in commands with a single regex scan
+    
+    Returns:
+        'help', 'exit', or None for an ordinary query
+    """
+    match = _CMD_RE.search(query)
+    if not match:
+        return None
+    return 'help' if match.group(1) else 'exit'
+
 
 class CampusVoiceAssistant:
     """Main class for the Voice-Controlled Campus Assistant"""
@@ -40,16 +96,33 @@ class CampusVoiceAssistant:
         self.use_voice_input = use_voice_input
         self.use_voice_output = use_voice_output
         
+        # Set once the last reply has been spoken, so the microphone can listen again
+        self._turn_spoken = threading.Event()
+        
         # Initialize components
         try:
             if use_voice_input:
                 self.speech_recognizer = SpeechRecognizer()
+                if self.speech_recognizer.microphone_available:
+                    # Only the latest utterances are kept (see _asr_loop)
+                    self._stt_q = queue.Queue(maxsize=2)
+                else:
+                    self.use_voice_input = False
+                    print("🎤 Voice input unavailable - using text input mode")
             else:
                 self.speech_recognizer = None
                 print("🎤 Voice input disabled - using text input mode")
             
             if use_voice_output:
-                self.tts = TextToSpeech(rate=150, volume=0.9)
+                # The engine lives on the speech thread, which voices one sentence at a time
+                self._speech_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tts')
+                self._speech_generation = 0
+                self.tts = self._speech_executor.submit(TextToSpeech, rate=150, volume=0.9).result()
+                if self.tts.playback_available:
+                    # Cached clips only help when they can be played; the
+                    # speech thread renders them while startup continues
+                    phrases = [*split_sentences(WELCOME_SPEECH), *split_sentences(GOODBYE_SPEECH)]
+                    self._speech_executor.submit(self.tts.precompute, phrases)
             else:
                 self.tts = None
                 print("🔊 Voice output disabled - using text output mode")
@@ -66,15 +139,71 @@ class CampusVoiceAssistant:
             sys.exit(1)
     
     def speak(self, text):
-        """Output text as speech or print to console"""
+        """
+        Output text as speech or print to console
+        
+        Sentences are queued on the speech thread and this returns at once;
+        use wait_for_speech() to block until they have been spoken.
+        """
         print(f"\n🤖 Assistant: {text}")
         if self.use_voice_output and self.tts:
-            self.tts.speak(text)
+            generation = self._speech_generation
+            for sentence in split_sentences(text):
+                self._speech_executor.submit(self._speak_sentence, sentence, generation)
+    
+    def _speak_sentence(self, sentence, generation):
+        """Speak one queued sentence unless speech was stopped after it was queued"""
+        if generation == self._speech_generation:
+            self.tts.speak(sentence)
+    
+    def _precompute_phrase(self, phrase, generation):
+        """Cache audio for one phrase unless speech was stopped after it was queued"""
+        if generation == self._speech_generation:
+            self.tts.precompute([phrase])
+    
+    def wait_for_speech(self):
+        """Block until every queued sentence has been spoken"""
+        if self.use_voice_output and self.tts:
+            self._speech_executor.submit(lambda: None).result()
+    
+    def stop_speaking(self):
+        """Drop queued sentences and cut off the one being spoken (barge-in)"""
+        if self.use_voice_output and self.tts:
+            self._speech_generation += 1
+            self.tts.stop()
+    
+    def _finish_turn(self):
+        """Let the microphone listen again once the reply queued so far has been spoken"""
+        if self.use_voice_output and self.tts:
+            # Runs on the speech thread after the reply's sentences
+            self._speech_executor.submit(self._turn_spoken.set)
+        else:
+            self._turn_spoken.set()
+    
+    def _asr_loop(self):
+        """Recognize utterances between turns and queue the transcripts"""
+        while True:
+            # Don't record our own voice
+            self._turn_spoken.wait()
+            text = self.speech_recognizer.get_text_from_speech()
+            if not text:
+                continue
+            self._turn_spoken.clear()
+            # Drop the oldest transcript rather than block the microphone
+            while True:
+                try:
+                    self._stt_q.put_nowait(text)
+                    break
+                except queue.Full:
+                    try:
+                        self._stt_q.get_nowait()
+                    except queue.Empty:
+                        pass
     
     def listen(self):
         """Get input from user (voice or text)"""
         if self.use_voice_input and self.speech_recognizer:
-            return self.speech_recognizer.get_text_from_speech()
+            return self._stt_q.get()
         else:
             try:
                 return input("\n👤 You: ").strip()
@@ -102,12 +231,15 @@ class CampusVoiceAssistant:
         
         return response
     
+    def cache_clear(self):
+        """Forget cached answers (call after the campus data is reloaded)"""
+        self.response_generator.cache_clear()
+    
     def is_exit_command(self, query):
         """Check if user wants to exit"""
         if not query:
             return False
-        exit_words = ['exit', 'quit', 'bye', 'goodbye', 'stop', 'end']
-        return any(word in query.lower() for word in exit_words)
+        return match_command(query) == 'exit'
     
     def show_welcome_message(self):
         """Display welcome message"""
@@ -126,44 +258,115 @@ Say 'help' for more options or 'quit' to exit.
         """
         print(welcome)
         if self.use_voice_output:
-            self.speak("Welcome to the Voice-Controlled Campus Assistant! How can I help you today?")
+            self.speak(WELCOME_SPEECH)
     
     def run(self):
         """Main loop to run the assistant"""
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            self.stop_speaking()
+            print("\n\n👋 Interrupted by user. Goodbye!")
+        
+        if self.use_voice_output and self.tts:
+            self._speech_executor.shutdown(wait=True)
+        
+        print("\n" + "=" * 60)
+        print("  Thank you for using Campus Voice Assistant!")
+        print("=" * 60 + "\n")
+    
+    async def run_async(self):
+        """
+        Run listening, answering and speaking as separate tasks
+        
+        The stages are connected by queues, so the next prompt (and, in
+        text mode, the user's typing) overlaps with the previous reply
+        being spoken.
+        """
         self.show_welcome_message()
+        self._finish_turn()
         
-        while True:
-            try:
-                # Get user input
-                query = self.listen()
+        if self.use_voice_output and self.tts and self.tts.playback_available:
+            # Synthesize the canned replies while the user thinks of a question,
+            # one phrase per job so a question skips whatever is left
+            generator = self.response_generator
+            canned = generator.greetings + generator.farewells + generator.unknown_responses
+            generation = self._speech_generation
+            for reply in canned:
+                for sentence in split_sentences(reply):
+                    self._speech_executor.submit(self._precompute_phrase, sentence, generation)
+        
+        if self.use_voice_input:
+            # Keep listening in the background between turns
+            threading.Thread(target=self._asr_loop, daemon=True).start()
+        
+        queries = asyncio.Queue()
+        responses = asyncio.Queue()
+        turn_done = asyncio.Event()  # Set once the last reply was printed
+        turn_done.set()
+        
+        async def asr_task():
+            while True:
+                await turn_done.wait()
+                try:
+                    query = await _in_daemon_thread(self.listen)
+                except Exception as e:
+                    print(f"\n❌ Error: {e}")
+                    continue
                 
                 if query is None:
                     continue
                 
-                # Check for exit
+                # A new question cuts off the previous answer
+                self.stop_speaking()
+                turn_done.clear()
+                await queries.put(query)
                 if self.is_exit_command(query):
-                    self.speak("Goodbye! Have a great day!")
-                    break
+                    return
+        
+        async def nlp_task():
+            while True:
+                query = await queries.get()
+                command = match_command(query)
+                
+                # Check for exit
+                if command == 'exit':
+                    await responses.put(None)
+                    return
                 
                 # Check for help
-                if query.lower() in ['help', 'commands', 'what can you do']:
+                if command == 'help':
                     print(self.response_generator.get_help_message())
+                    self._finish_turn()
+                    turn_done.set()
                     continue
                 
                 # Process and respond
-                response = self.process_query(query)
+                try:
+                    response = await asyncio.to_thread(self.process_query, query)
+                except Exception as e:
+                    print(f"\n❌ Error: {e}")
+                    response = "Sorry, something went wrong. Please try again."
+                await responses.put(response)
+        
+        async def tts_task():
+            while True:
+                response = await responses.get()
+                if response is None:
+                    self.speak(GOODBYE_SPEECH)
+                    await asyncio.to_thread(self.wait_for_speech)
+                    return
                 self.speak(response)
-                
-            except KeyboardInterrupt:
-                print("\n\n👋 Interrupted by user. Goodbye!")
-                break
-            except Exception as e:
-                print(f"\n❌ Error: {e}")
-                self.speak("Sorry, something went wrong. Please try again.")
+                self._finish_turn()
+                turn_done.set()
         
-        print("\n" + "=" * 60)
-        print("  Thank you for using Campus Voice Assistant!")
-        print("=" * 60 + "\n")
+        tasks = [asyncio.create_task(task()) for task in (asr_task, nlp_task, tts_task)]
+        try:
+            await tasks[-1]
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
 
 def main():
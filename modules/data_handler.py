@@ -5,7 +5,48 @@ Handles loading and querying data from JSON files
 
 import json
 import os
-from datetime import datetime, timedelta
+import re
+import time
+from collections import Counter, defaultdict
+from functools import cached_property, lru_cache
+
+# orjson parses noticeably faster; its JSONDecodeError subclasses json's
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+FACILITY_OVERVIEW = ("🏫 Campus Facilities:\n\n"
+                     "📚 Library - Central Library\n"
+                     "🍽️ Canteen - Multiple food options\n"
+                     "🏠 Hostel - Boys and Girls hostels\n"
+                     "🏆 Sports - Indoor and outdoor facilities\n"
+                     "🏥 Medical - 24/7 health center\n"
+                     "🚌 Transport - Bus service available\n\n"
+                     "Say 'Tell me about [facility name]' for details.")
+
+
+@lru_cache(maxsize=1)
+def _today_key(minute_bucket):
+    """
+    Today's weekday and tomorrow's date, computed once per minute
+    
+    Args:
+        minute_bucket: Minutes since the epoch; a new value refreshes the cache
+        
+    Returns:
+        Tuple of (weekday name in lowercase, tomorrow as 'YYYY-MM-DD')
+    """
+    now = time.localtime()
+    # Noon tomorrow, so DST changes can't push the date a day off
+    tomorrow = time.localtime(time.mktime((now.tm_year, now.tm_mon, now.tm_mday + 1,
+                                           12, 0, 0, 0, 0, -1)))
+    return time.strftime('%A', now).lower(), time.strftime('%Y-%m-%d', tomorrow)
+
+
+def _today():
+    return _today_key(int(time.time() // 60))
 
 
 class DataHandler:
@@ -22,14 +63,137 @@ class DataHandler:
         self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.data_dir = os.path.join(self.base_dir, data_dir)
         
-        # Load all data files
-        self.timetable = self._load_json("timetable.json")
-        self.exams = self._load_json("exams.json")
-        self.departments = self._load_json("departments.json")
-        self.campus_info = self._load_json("campus_info.json")
-        self.faqs = self._load_json("faqs.json")
+        # Data files are loaded on first access (see the properties below)
+        
+        # Unknown-intent queries fall back to FAQ search, often with the same text
+        self._faq_answer = lru_cache(maxsize=128)(self._faq_answer_uncached)
+        print("📚 Data handler ready!")
+    
+    # Keys are normalized once at load (lowercase days, uppercase department
+    # codes) so queries can look them up directly
+    
+    @cached_property
+    def timetable(self):
+        return {day.lower(): {dept.upper(): schedule for dept, schedule in day_schedule.items()}
+                for day, day_schedule in self._load_json("timetable.json").items()}
+    
+    @cached_property
+    def exams(self):
+        exams = self._load_json("exams.json")
+        if 'upcoming_exams' in exams:
+            exams['upcoming_exams'] = {dept.upper(): dept_exams
+                                       for dept, dept_exams in exams['upcoming_exams'].items()}
+        return exams
+    
+    @cached_property
+    def departments(self):
+        departments = self._load_json("departments.json")
+        if 'departments' in departments:
+            departments['departments'] = {code.upper(): info
+                                          for code, info in departments['departments'].items()}
+        return departments
+    
+    @cached_property
+    def campus_info(self):
+        return self._load_json("campus_info.json")
+    
+    @cached_property
+    def faqs(self):
+        return self._load_json("faqs.json")
+    
+    @cached_property
+    def _timetable_text(self):
+        """
+        Format every timetable answer once
         
-        print("📚 Data files loaded successfully!")
+        Returns:
+            Dictionary of {(day, department): text}, with department None
+            for the all-departments view of a day
+        """
+        texts = {}
+        for day, day_schedule in self.timetable.items():
+            day_title = day.capitalize()
+            overview = [f"📅 Timetable for {day_title}:\n\n"]
+            for dept, schedule in day_schedule.items():
+                parts = [f"📅 {dept} Schedule for {day_title}:\n\n"]
+                overview.append(f"📌 {dept} Department:\n")
+                for class_info in schedule:
+                    parts.append(f"⏰ {class_info['time']}\n")
+                    parts.append(f"   📖 {class_info['subject']}\n")
+                    parts.append(f"   🚪 Room: {class_info['room']}\n")
+                    parts.append(f"   👨‍🏫 Faculty: {class_info['faculty']}\n\n")
+                    overview.append(f"  ⏰ {class_info['time']} - {class_info['subject']} ({class_info['room']})\n")
+                overview.append("\n")
+                texts[(day, dept)] = "".join(parts)
+            texts[(day, None)] = "".join(overview)
+        return texts
+    
+    @cached_property
+    def _exam_text(self):
+        """
+        Format every exam schedule answer once
+        
+        Returns:
+            Dictionary of {department: text}, with None for the overview
+        """
+        texts = {}
+        overview = ["📝 Upcoming Examination Schedule:\n\n"]
+        for dept, exams in self.exams['upcoming_exams'].items():
+            parts = [f"📝 Upcoming Exams for {dept}:\n\n"]
+            for exam in exams:
+                parts.append(f"📚 {exam['subject']}\n")
+                parts.append(f"   📅 Date: {exam['date']} ({exam['day']})\n")
+                parts.append(f"   ⏰ Time: {exam['time']}\n")
+                parts.append(f"   🚪 Room: {exam['room']}\n")
+                parts.append(f"   📋 Type: {exam['type']}\n\n")
+            texts[dept] = "".join(parts)
+            
+            overview.append(f"📌 {dept} Department:\n")
+            for exam in exams[:3]:  # Show only first 3 exams per dept
+                overview.append(f"  • {exam['subject']} - {exam['date']} ({exam['time']})\n")
+            overview.append("\n")
+        
+        # Add exam rules
+        if 'exam_rules' in self.exams:
+            overview.append("📋 Important Rules:\n")
+            for rule in self.exams['exam_rules'][:3]:
+                overview.append(f"  • {rule}\n")
+        
+        texts[None] = "".join(overview)
+        return texts
+    
+    @cached_property
+    def _exams_by_date(self):
+        """Map each exam date to its (department, exam) pairs, in file order"""
+        by_date = defaultdict(list)
+        for dept, exams in self.exams.get('upcoming_exams', {}).items():
+            for exam in exams:
+                by_date[exam['date']].append((dept, exam))
+        return by_date
+    
+    @cached_property
+    def _faq_matcher(self):
+        """
+        Build a single regex over every FAQ keyword plus a credit table
+        
+        Scoring counts each keyword that occurs anywhere in the query, so a
+        longer match ('fees') also credits the keywords inside it ('fee').
+        
+        Returns:
+            Tuple of (compiled pattern or None, {match: [(faq_index, keyword_index)]})
+        """
+        faqs = self.faqs.get('faqs', [])
+        keywords = sorted({kw for faq in faqs for kw in faq['keywords']}, key=len, reverse=True)
+        if not keywords:
+            return None, {}
+        
+        pattern = re.compile('(?=(' + '|'.join(map(re.escape, keywords)) + '))')
+        credits = {
+            match: [(i, j) for i, faq in enumerate(faqs)
+                    for j, kw in enumerate(faq['keywords']) if kw in match]
+            for match in keywords
+        }
+        return pattern, credits
     
     def _load_json(self, filename):
         """
@@ -43,8 +207,8 @@ class DataHandler:
         """
         filepath = os.path.join(self.data_dir, filename)
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(filepath, 'rb') as f:
+                return _json_loads(f.read())
         except FileNotFoundError:
             print(f"⚠️ Warning: {filename} not found")
             return {}
@@ -66,43 +230,24 @@ class DataHandler:
         if not self.timetable:
             return "Sorry, timetable data is not available."
         
-        # Default to today if no day specified
-        if not day:
-            day = datetime.now().strftime('%A').lower()
-        
-        day = day.lower()
+        # Normalize once; default to today if no day specified
+        day = day.lower() if day else _today()[0]
+        department = department.upper() if department else None
         
         if day not in self.timetable:
             if day == 'sunday':
                 return "Sunday is a holiday. No classes scheduled."
             return f"No timetable available for {day.capitalize()}."
         
-        day_schedule = self.timetable[day]
-        
         # If department specified, return only that department's schedule
         if department:
-            department = department.upper()
-            if department in day_schedule:
-                schedule = day_schedule[department]
-                response = f"📅 {department} Schedule for {day.capitalize()}:\n\n"
-                for class_info in schedule:
-                    response += f"⏰ {class_info['time']}\n"
-                    response += f"   📖 {class_info['subject']}\n"
-                    response += f"   🚪 Room: {class_info['room']}\n"
-                    response += f"   👨‍🏫 Faculty: {class_info['faculty']}\n\n"
-                return response
-            else:
+            text = self._timetable_text.get((day, department))
+            if text is None:
                 return f"No schedule found for {department} department on {day.capitalize()}."
+            return text
         
         # Return all departments' schedules
-        response = f"📅 Timetable for {day.capitalize()}:\n\n"
-        for dept, schedule in day_schedule.items():
-            response += f"📌 {dept} Department:\n"
-            for class_info in schedule:
-                response += f"  ⏰ {class_info['time']} - {class_info['subject']} ({class_info['room']})\n"
-            response += "\n"
-        
-        return response
+        return self._timetable_text[(day, None)]
     
     def get_exam_schedule(self, department=None):
         """
@@ -117,63 +262,36 @@ class DataHandler:
         if not self.exams or 'upcoming_exams' not in self.exams:
             return "Sorry, exam schedule is not available."
         
-        upcoming = self.exams['upcoming_exams']
-        
         if department:
             department = department.upper()
-            if department in upcoming:
-                exams = upcoming[department]
-                response = f"📝 Upcoming Exams for {department}:\n\n"
-                for exam in exams:
-                    response += f"📚 {exam['subject']}\n"
-                    response += f"   📅 Date: {exam['date']} ({exam['day']})\n"
-                    response += f"   ⏰ Time: {exam['time']}\n"
-                    response += f"   🚪 Room: {exam['room']}\n"
-                    response += f"   📋 Type: {exam['type']}\n\n"
-                return response
-            else:
+            text = self._exam_text.get(department)
+            if text is None:
                 return f"No exam schedule found for {department} department."
+            return text
         
         # Return all departments' exam schedules
-        response = "📝 Upcoming Examination Schedule:\n\n"
-        for dept, exams in upcoming.items():
-            response += f"📌 {dept} Department:\n"
-            for exam in exams[:3]:  # Show only first 3 exams per dept
-                response += f"  • {exam['subject']} - {exam['date']} ({exam['time']})\n"
-            response += "\n"
-        
-        # Add exam rules
-        if 'exam_rules' in self.exams:
-            response += "📋 Important Rules:\n"
-            for rule in self.exams['exam_rules'][:3]:
-                response += f"  • {rule}\n"
-        
-        return response
+        return self._exam_text[None]
     
     def get_tomorrow_exams(self, department=None):
         """Get exams scheduled for tomorrow"""
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
-        
         if not self.exams or 'upcoming_exams' not in self.exams:
             return "Sorry, exam schedule is not available."
         
-        response = "📝 Tomorrow's Exams:\n\n"
-        found = False
-        
-        for dept, exams in self.exams['upcoming_exams'].items():
-            if department and dept.upper() != department.upper():
-                continue
-            for exam in exams:
-                if exam['date'] == tomorrow:
-                    found = True
-                    response += f"📚 {dept} - {exam['subject']}\n"
-                    response += f"   ⏰ Time: {exam['time']}\n"
-                    response += f"   🚪 Room: {exam['room']}\n\n"
+        scheduled = self._exams_by_date.get(_today()[1], [])
+        if department:
+            department = department.upper()
+            scheduled = [(dept, exam) for dept, exam in scheduled if dept == department]
         
-        if not found:
+        if not scheduled:
             return "No exams scheduled for tomorrow."
         
-        return response
+        parts = ["📝 Tomorrow's Exams:\n\n"]
+        for dept, exam in scheduled:
+            parts.append(f"📚 {dept} - {exam['subject']}\n")
+            parts.append(f"   ⏰ Time: {exam['time']}\n")
+            parts.append(f"   🚪 Room: {exam['room']}\n\n")
+        
+        return "".join(parts)
     
     def get_department_info(self, department=None):
         """
@@ -188,37 +306,63 @@ class DataHandler:
         if not self.departments or 'departments' not in self.departments:
             return "Sorry, department information is not available."
         
-        depts = self.departments['departments']
-        
         if department:
             department = department.upper()
-            if department in depts:
-                info = depts[department]
-                response = f"🏛️ {info['full_name']} ({department})\n\n"
-                response += f"👤 HOD: {info['hod']}\n"
-                response += f"📧 Email: {info['hod_contact']}\n"
-                response += f"📍 Office: {info['office']}\n"
-                response += f"📞 Phone: {info['phone']}\n"
-                response += f"📅 Established: {info['established']}\n"
-                response += f"👨‍🏫 Total Faculty: {info['total_faculty']}\n"
-                response += f"👨‍🎓 Total Students: {info['total_students']}\n\n"
-                response += f"🔬 Labs: {', '.join(info['labs'])}\n\n"
-                response += f"💼 Placements:\n"
-                response += f"   Average Package: {info['placements']['average_package']}\n"
-                response += f"   Highest Package: {info['placements']['highest_package']}\n"
-                response += f"   Placement Rate: {info['placements']['placement_rate']}\n"
-                return response
-            else:
-                return f"Department '{department}' not found. Available: CSE, ECE, MECH, CIVIL, EEE"
+            text = self._department_text.get(department)
+            if text is None:
+                return f"Department '{department}' not found. Available: {self._department_codes}"
+            return text
         
         # Return brief info about all departments
-        response = "🏛️ Available Departments:\n\n"
-        for dept_code, info in depts.items():
-            response += f"📌 {dept_code} - {info['full_name']}\n"
-            response += f"   HOD: {info['hod']}\n"
-            response += f"   Office: {info['office']}\n\n"
+        return self._department_text[None]
+    
+    @cached_property
+    def _department_text(self):
+        """
+        Format every department answer once
         
-        return response
+        Returns:
+            Dictionary of {department code: text}, with None for the overview
+        """
+        texts = {}
+        overview = ["🏛️ Available Departments:\n\n"]
+        for dept_code, info in self.departments['departments'].items():
+            parts = [f"🏛️ {info['full_name']} ({dept_code})\n\n"]
+            parts.append(f"👤 HOD: {info['hod']}\n")
+            parts.append(f"📧 Email: {info['hod_contact']}\n")
+            parts.append(f"📍 Office: {info['office']}\n")
+            parts.append(f"📞 Phone: {info['phone']}\n")
+            parts.append(f"📅 Established: {info['established']}\n")
+            parts.append(f"👨‍🏫 Total Faculty: {info['total_faculty']}\n")
+            parts.append(f"👨‍🎓 Total Students: {info['total_students']}\n\n")
+            parts.append(f"🔬 Labs: {', '.join(info['labs'])}\n\n")
+            parts.append(f"💼 Placements:\n")
+            parts.append(f"   Average Package: {info['placements']['average_package']}\n")
+            parts.append(f"   Highest Package: {info['placements']['highest_package']}\n")
+            parts.append(f"   Placement Rate: {info['placements']['placement_rate']}\n")
+            texts[dept_code] = "".join(parts)
+            
+            overview.append(f"📌 {dept_code} - {info['full_name']}\n")
+            overview.append(f"   HOD: {info['hod']}\n")
+            overview.append(f"   Office: {info['office']}\n\n")
+        
+        texts[None] = "".join(overview)
+        return texts
+    
+    @cached_property
+    def _department_codes(self):
+        """Comma-separated department codes for 'not found' replies"""
+        return ", ".join(self.departments['departments'])
+    
+    # Facility names users ask about, mapped to the campus_info section that answers them
+    FACILITY_ALIASES = {
+        'library': 'library',
+        'canteen': 'canteen', 'food': 'canteen',
+        'hostel': 'hostel', 'accommodation': 'hostel',
+        'sports': 'sports', 'gym': 'sports',
+        'medical': 'medical', 'hospital': 'medical', 'health': 'medical',
+        'bus': 'transport', 'transport': 'transport',
+    }
     
     def get_facility_info(self, facility=None):
         """
@@ -233,93 +377,97 @@ class DataHandler:
         if not self.campus_info or 'facilities' not in self.campus_info:
             return "Sorry, facility information is not available."
         
-        facilities = self.campus_info['facilities']
-        
         if facility:
             facility = facility.lower()
-            
-            if facility == 'library' and 'library' in facilities:
-                lib = facilities['library']
-                return (f"📚 {lib['name']}\n\n"
-                       f"📍 Location: {lib['location']}\n"
-                       f"⏰ Timings: {lib['timings']}\n"
-                       f"📖 Total Books: {lib['total_books']}\n"
-                       f"💻 Digital Resources: {lib['digital_resources']}\n"
-                       f"📞 Contact: {lib['contact']}\n"
-                       f"🔧 Services: {', '.join(lib['services'])}")
-            
-            elif facility in ['canteen', 'food'] and 'canteen' in facilities:
-                canteens = facilities['canteen']
-                response = "🍽️ Campus Canteens:\n\n"
-                for name, info in canteens.items():
-                    response += f"📌 {name.replace('_', ' ').title()}\n"
-                    response += f"   📍 Location: {info['location']}\n"
-                    response += f"   ⏰ Timings: {info['timings']}\n\n"
-                return response
-            
-            elif facility in ['hostel', 'accommodation'] and 'hostel' in facilities:
-                hostel = facilities['hostel']
-                response = "🏠 Hostel Information:\n\n"
-                response += f"👦 Boys Hostel:\n"
-                response += f"   Blocks: {', '.join(hostel['boys_hostel']['blocks'])}\n"
-                response += f"   Warden: {hostel['boys_hostel']['warden']}\n"
-                response += f"   Contact: {hostel['boys_hostel']['contact']}\n\n"
-                response += f"👧 Girls Hostel:\n"
-                response += f"   Blocks: {', '.join(hostel['girls_hostel']['blocks'])}\n"
-                response += f"   Warden: {hostel['girls_hostel']['warden']}\n"
-                response += f"   Contact: {hostel['girls_hostel']['contact']}\n\n"
-                response += f"🍽️ Mess Timings:\n"
-                for meal, time in hostel['mess_timing'].items():
-                    response += f"   {meal.capitalize()}: {time}\n"
-                return response
-            
-            elif facility in ['sports', 'gym'] and 'sports' in facilities:
-                sports = facilities['sports']
-                response = "🏆 Sports Facilities:\n\n"
-                response += f"🏠 Indoor: {', '.join(sports['indoor'])}\n"
-                response += f"🌳 Outdoor: {', '.join(sports['outdoor'])}\n"
-                response += f"⏰ Sports Complex: {sports['sports_complex_timing']}\n"
-                response += f"⏰ Gym: {sports['gym_timing']}\n"
-                response += f"👤 Sports Officer: {sports['sports_officer']}\n"
-                response += f"📞 Contact: {sports['contact']}"
-                return response
-            
-            elif facility in ['medical', 'hospital', 'health'] and 'medical' in facilities:
-                medical = facilities['medical']
-                return (f"🏥 Health Center\n\n"
-                       f"📍 Location: {medical['health_center']}\n"
-                       f"⏰ Timings: {medical['timings']}\n"
-                       f"👨‍⚕️ Doctor: {medical['doctor']}\n"
-                       f"📞 Contact: {medical['contact']}\n"
-                       f"🚑 Ambulance: {medical['ambulance']}\n"
-                       f"🔧 Services: {', '.join(medical['services'])}")
-            
-            elif facility in ['bus', 'transport'] and 'transport' in facilities:
-                transport = facilities['transport']
-                return (f"🚌 Transport Facility\n\n"
-                       f"🛤️ Bus Routes: {transport['bus_routes']}\n"
-                       f"🚌 Total Buses: {transport['total_buses']}\n"
-                       f"⏰ Timing: {transport['timing']}\n"
-                       f"👤 Transport Officer: {transport['transport_officer']}\n"
-                       f"📞 Contact: {transport['contact']}")
-            
-            else:
+            text = self._facility_text.get(self.FACILITY_ALIASES.get(facility))
+            if text is None:
                 return f"Information about '{facility}' is not available."
+            return text
         
         # Return general facility overview
-        response = "🏫 Campus Facilities:\n\n"
-        response += "📚 Library - Central Library\n"
-        response += "🍽️ Canteen - Multiple food options\n"
-        response += "🏠 Hostel - Boys and Girls hostels\n"
-        response += "🏆 Sports - Indoor and outdoor facilities\n"
-        response += "🏥 Medical - 24/7 health center\n"
-        response += "🚌 Transport - Bus service available\n\n"
-        response += "Say 'Tell me about [facility name]' for details."
-        
-        return response
+        return FACILITY_OVERVIEW
+    
+    @cached_property
+    def _facility_text(self):
+        """Format each facility section present in the data once: {section: text}"""
+        formatters = {
+            'library': self._format_library,
+            'canteen': self._format_canteen,
+            'hostel': self._format_hostel,
+            'sports': self._format_sports,
+            'medical': self._format_medical,
+            'transport': self._format_transport,
+        }
+        facilities = self.campus_info['facilities']
+        return {section: format_section(facilities[section])
+                for section, format_section in formatters.items() if section in facilities}
+    
+    def _format_library(self, lib):
+        return (f"📚 {lib['name']}\n\n"
+               f"📍 Location: {lib['location']}\n"
+               f"⏰ Timings: {lib['timings']}\n"
+               f"📖 Total Books: {lib['total_books']}\n"
+               f"💻 Digital Resources: {lib['digital_resources']}\n"
+               f"📞 Contact: {lib['contact']}\n"
+               f"🔧 Services: {', '.join(lib['services'])}")
+    
+    def _format_canteen(self, canteens):
+        parts = ["🍽️ Campus Canteens:\n\n"]
+        for name, info in canteens.items():
+            parts.append(f"📌 {name.replace('_', ' ').title()}\n")
+            parts.append(f"   📍 Location: {info['location']}\n")
+            parts.append(f"   ⏰ Timings: {info['timings']}\n\n")
+        return "".join(parts)
+    
+    def _format_hostel(self, hostel):
+        parts = ["🏠 Hostel Information:\n\n"]
+        parts.append(f"👦 Boys Hostel:\n")
+        parts.append(f"   Blocks: {', '.join(hostel['boys_hostel']['blocks'])}\n")
+        parts.append(f"   Warden: {hostel['boys_hostel']['warden']}\n")
+        parts.append(f"   Contact: {hostel['boys_hostel']['contact']}\n\n")
+        parts.append(f"👧 Girls Hostel:\n")
+        parts.append(f"   Blocks: {', '.join(hostel['girls_hostel']['blocks'])}\n")
+        parts.append(f"   Warden: {hostel['girls_hostel']['warden']}\n")
+        parts.append(f"   Contact: {hostel['girls_hostel']['contact']}\n\n")
+        parts.append(f"🍽️ Mess Timings:\n")
+        for meal, time in hostel['mess_timing'].items():
+            parts.append(f"   {meal.capitalize()}: {time}\n")
+        return "".join(parts)
+    
+    def _format_sports(self, sports):
+        parts = ["🏆 Sports Facilities:\n\n"]
+        parts.append(f"🏠 Indoor: {', '.join(sports['indoor'])}\n")
+        parts.append(f"🌳 Outdoor: {', '.join(sports['outdoor'])}\n")
+        parts.append(f"⏰ Sports Complex: {sports['sports_complex_timing']}\n")
+        parts.append(f"⏰ Gym: {sports['gym_timing']}\n")
+        parts.append(f"👤 Sports Officer: {sports['sports_officer']}\n")
+        parts.append(f"📞 Contact: {sports['contact']}")
+        return "".join(parts)
+    
+    def _format_medical(self, medical):
+        return (f"🏥 Health Center\n\n"
+               f"📍 Location: {medical['health_center']}\n"
+               f"⏰ Timings: {medical['timings']}\n"
+               f"👨‍⚕️ Doctor: {medical['doctor']}\n"
+               f"📞 Contact: {medical['contact']}\n"
+               f"🚑 Ambulance: {medical['ambulance']}\n"
+               f"🔧 Services: {', '.join(medical['services'])}")
+    
+    def _format_transport(self, transport):
+        return (f"🚌 Transport Facility\n\n"
+               f"🛤️ Bus Routes: {transport['bus_routes']}\n"
+               f"🚌 Total Buses: {transport['total_buses']}\n"
+               f"⏰ Timing: {transport['timing']}\n"
+               f"👤 Transport Officer: {transport['transport_officer']}\n"
+               f"📞 Contact: {transport['contact']}")
     
     def get_events(self):
         """Get upcoming events"""
+        return self._events_text
+    
+    @cached_property
+    def _events_text(self):
+        """Events answer, formatted once since the data is static"""
         if not self.campus_info or 'events' not in self.campus_info:
             return "Sorry, events information is not available."
         
@@ -328,14 +476,14 @@ class DataHandler:
         if not events:
             return "No upcoming events scheduled."
         
-        response = "🎉 Upcoming Events:\n\n"
+        parts = ["🎉 Upcoming Events:\n\n"]
         for event in events:
-            response += f"📌 {event['name']}\n"
-            response += f"   📅 Date: {event['date']}\n"
-            response += f"   📍 Venue: {event['venue']}\n"
-            response += f"   📝 {event['description']}\n\n"
+            parts.append(f"📌 {event['name']}\n")
+            parts.append(f"   📅 Date: {event['date']}\n")
+            parts.append(f"   📍 Venue: {event['venue']}\n")
+            parts.append(f"   📝 {event['description']}\n\n")
         
-        return response
+        return "".join(parts)
     
     def get_faq_answer(self, query):
         """
@@ -347,40 +495,47 @@ class DataHandler:
         Returns:
             FAQ answer if found, None otherwise
         """
+        return self._faq_answer(query.lower())
+    
+    def _faq_answer_uncached(self, query):
+        """get_faq_answer for a lowercased query, memoized per instance"""
         if not self.faqs or 'faqs' not in self.faqs:
             return None
         
-        query_lower = query.lower()
-        best_match = None
-        best_score = 0
+        pattern, credits = self._faq_matcher
+        if pattern is None:
+            return None
         
-        for faq in self.faqs['faqs']:
-            score = 0
-            for keyword in faq['keywords']:
-                if keyword in query_lower:
-                    score += 1
-            
-            if score > best_score:
-                best_score = score
-                best_match = faq
+        found = set()
+        for match in pattern.finditer(query):
+            found.update(credits[match.group(1)])
         
-        if best_match and best_score > 0:
+        if found:
+            scores = Counter(i for i, _ in found)
+            # Highest score wins; ties go to the FAQ listed first
+            best = min(scores, key=lambda i: (-scores[i], i))
+            best_match = self.faqs['faqs'][best]
             return f"❓ {best_match['question']}\n\n💡 {best_match['answer']}"
         
         return None
     
     def get_important_contacts(self):
         """Get important emergency contacts"""
+        return self._contacts_text
+    
+    @cached_property
+    def _contacts_text(self):
+        """Contacts answer, formatted once since the data is static"""
         if not self.campus_info or 'important_contacts' not in self.campus_info:
             return "Sorry, contact information is not available."
         
         contacts = self.campus_info['important_contacts']
         
-        response = "📞 Important Contacts:\n\n"
+        parts = ["📞 Important Contacts:\n\n"]
         for name, number in contacts.items():
-            response += f"📌 {name.replace('_', ' ').title()}: {number}\n"
+            parts.append(f"📌 {name.replace('_', ' ').title()}: {number}\n")
         
-        return response
+        return "".join(parts)
 
 
 # Test the module
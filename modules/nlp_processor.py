@@ -4,16 +4,64 @@ Handles intent identification and keyword extraction
 """
 
 import re
-from datetime import datetime, timedelta
+import sys
+import functools
+from collections import Counter
+from datetime import date, timedelta
+
+# Optional: pyahocorasick finds every keyword occurrence in one pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Intent names, interned so the response generator's dispatch compares them
+# by identity across modules
+INTENT_TIMETABLE = sys.intern('timetable')
+INTENT_EXAM = sys.intern('exam')
+INTENT_DEPARTMENT = sys.intern('department')
+INTENT_FACILITY = sys.intern('facility')
+INTENT_EVENT = sys.intern('event')
+INTENT_FAQ = sys.intern('faq')
+INTENT_GREETING = sys.intern('greeting')
+INTENT_EXIT = sys.intern('exit')
+INTENT_UNKNOWN = sys.intern('unknown')
+
+_WS_RE = re.compile(r'\s+')
+_PUNCT_RE = re.compile(r"[^\w\s']")
+
+# Placeholders in day_mappings, resolved to a weekday when a query is processed
+_TODAY = object()
+_TOMORROW = object()
+
+
+@functools.lru_cache(maxsize=2)
+def _relative_day_names(ordinal):
+    """
+    Weekday names for a date and the day after it
+    
+    Args:
+        ordinal: date.toordinal() of the day to resolve
+        
+    Returns:
+        Tuple of (today, tomorrow) lowercase weekday names
+    """
+    day = date.fromordinal(ordinal)
+    return day.strftime('%A').lower(), (day + timedelta(days=1)).strftime('%A').lower()
 
 
 class IntentProcessor:
     """Handles NLP tasks including intent identification and entity extraction"""
     
+    # Attributes are fixed after __init__, so skip the per-instance __dict__
+    __slots__ = ('intents', '_keyword_re', '_keyword_credits', '_keyword_automaton',
+                 'department_mappings', '_dept_items', 'day_mappings', 'facilities',
+                 '_entity_re', '_entity_credits', '_cached_query')
+    
     def __init__(self):
         # Define intents with their associated keywords
         self.intents = {
-            'timetable': {
+            INTENT_TIMETABLE: {
                 'keywords': ['timetable', 'class', 'schedule', 'lecture', 'period', 
                             'timing', 'classes', 'today', 'tomorrow', 'when'],
                 'patterns': [
@@ -25,7 +73,7 @@ class IntentProcessor:
                     r'schedule.*for'
                 ]
             },
-            'exam': {
+            INTENT_EXAM: {
                 'keywords': ['exam', 'examination', 'test', 'internal', 'semester',
                             'exam schedule', 'exam date', 'exam time', 'exams'],
                 'patterns': [
@@ -36,7 +84,7 @@ class IntentProcessor:
                     r'upcoming.*exam'
                 ]
             },
-            'department': {
+            INTENT_DEPARTMENT: {
                 'keywords': ['department', 'hod', 'head', 'faculty', 'professor',
                             'teacher', 'staff', 'office', 'contact', 'phone'],
                 'patterns': [
@@ -46,7 +94,7 @@ class IntentProcessor:
                     r'about.*department'
                 ]
             },
-            'facility': {
+            INTENT_FACILITY: {
                 'keywords': ['library', 'canteen', 'hostel', 'sports', 'gym',
                             'medical', 'hospital', 'bus', 'transport', 'wifi'],
                 'patterns': [
@@ -57,7 +105,7 @@ class IntentProcessor:
                     r'bus.*route'
                 ]
             },
-            'event': {
+            INTENT_EVENT: {
                 'keywords': ['event', 'fest', 'cultural', 'technical', 'seminar',
                             'workshop', 'placement', 'drive', 'program'],
                 'patterns': [
@@ -66,7 +114,7 @@ class IntentProcessor:
                     r'when.*placement'
                 ]
             },
-            'faq': {
+            INTENT_FAQ: {
                 'keywords': ['leave', 'fee', 'certificate', 'attendance', 'scholarship',
                             'apply', 'bonafide', 'rules', 'how to', 'procedure'],
                 'patterns': [
@@ -75,7 +123,7 @@ class IntentProcessor:
                     r'attendance.*requirement'
                 ]
             },
-            'greeting': {
+            INTENT_GREETING: {
                 'keywords': ['hello', 'hi', 'hey', 'good morning', 'good afternoon',
                             'good evening', 'help', 'assist'],
                 'patterns': [
@@ -84,7 +132,7 @@ class IntentProcessor:
                     r'^hey'
                 ]
             },
-            'exit': {
+            INTENT_EXIT: {
                 'keywords': ['bye', 'goodbye', 'exit', 'quit', 'stop', 'thank you',
                             'thanks', 'done'],
                 'patterns': [
@@ -95,6 +143,36 @@ class IntentProcessor:
             }
         }
         
+        # Compile each intent's patterns once instead of per query, and fix the
+        # confidence denominator (every keyword plus every pattern at weight 2)
+        for intent_data in self.intents.values():
+            intent_data['compiled_patterns'] = [re.compile(p) for p in intent_data['patterns']]
+            intent_data['max_possible'] = len(intent_data['keywords']) + 2 * len(intent_data['patterns'])
+        
+        # All intent keywords in one alternation, longest first. The lookahead
+        # lets matches overlap, and at each position the longest keyword wins;
+        # any shorter keywords inside it are credited via _keyword_credits.
+        keywords = sorted({kw for data in self.intents.values() for kw in data['keywords']},
+                          key=len, reverse=True)
+        self._keyword_re = re.compile('(?=(' + '|'.join(map(re.escape, keywords)) + '))')
+        self._keyword_credits = {
+            keyword: [(kw, name) for name, data in self.intents.items()
+                      for kw in data['keywords'] if kw in keyword]
+            for keyword in keywords
+        }
+        
+        # With pyahocorasick, one automaton reports every keyword occurrence
+        # (overlapping ones included), so no credit table is needed
+        self._keyword_automaton = None
+        if ahocorasick is not None:
+            self._keyword_automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                self._keyword_automaton.add_word(keyword, [
+                    (keyword, name) for name, data in self.intents.items()
+                    if keyword in data['keywords']
+                ])
+            self._keyword_automaton.make_automaton()
+        
         # Department name mappings
         self.department_mappings = {
             'cse': 'CSE', 'computer': 'CSE', 'computer science': 'CSE', 'cs': 'CSE',
@@ -104,10 +182,14 @@ class IntentProcessor:
             'eee': 'EEE', 'electrical': 'EEE', 'ee': 'EEE'
         }
         
+        # Longest key first, so e.g. 'mechanical' beats the 'ec' inside it
+        self._dept_items = sorted(self.department_mappings.items(),
+                                  key=lambda item: len(item[0]), reverse=True)
+        
         # Day mappings
         self.day_mappings = {
-            'today': self._get_today(),
-            'tomorrow': self._get_tomorrow(),
+            'today': _TODAY,
+            'tomorrow': _TOMORROW,
             'monday': 'monday', 'mon': 'monday',
             'tuesday': 'tuesday', 'tue': 'tuesday',
             'wednesday': 'wednesday', 'wed': 'wednesday',
@@ -116,15 +198,38 @@ class IntentProcessor:
             'saturday': 'saturday', 'sat': 'saturday',
             'sunday': 'sunday', 'sun': 'sunday'
         }
+        
+        # Facility entities
+        self.facilities = ['library', 'canteen', 'hostel', 'sports', 'gym',
+                           'medical', 'hospital', 'bus', 'transport']
+        
+        # Entity keys of every category in one alternation, built like
+        # _keyword_re. Each match credits (category, priority, value) for
+        # every key it contains; priority is the key's position in its list.
+        categories = {
+            'department': self._dept_items,
+            'day': list(self.day_mappings.items()),
+            'facility': [(facility, facility) for facility in self.facilities],
+        }
+        entity_keys = sorted({key for pairs in categories.values() for key, _ in pairs},
+                             key=len, reverse=True)
+        self._entity_re = re.compile('(?=(' + '|'.join(map(re.escape, entity_keys)) + '))')
+        self._entity_credits = {
+            match: [(category, priority, value) for category, pairs in categories.items()
+                    for priority, (key, value) in enumerate(pairs) if key in match]
+            for match in entity_keys
+        }
+        
+        # Results depend only on the text and the date (for today/tomorrow)
+        self._cached_query = functools.lru_cache(maxsize=256)(self._process_query_uncached)
     
     def _get_today(self):
         """Get today's day name"""
-        return datetime.now().strftime('%A').lower()
+        return _relative_day_names(date.today().toordinal())[0]
     
     def _get_tomorrow(self):
         """Get tomorrow's day name"""
-        tomorrow = datetime.now() + timedelta(days=1)
-        return tomorrow.strftime('%A').lower()
+        return _relative_day_names(date.today().toordinal())[1]
     
     def preprocess_text(self, text):
         """
@@ -143,10 +248,10 @@ class IntentProcessor:
         text = text.lower().strip()
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         
         # Remove special characters but keep apostrophes
-        text = re.sub(r"[^\w\s']", '', text)
+        text = _PUNCT_RE.sub('', text)
         
         return text
     
@@ -160,40 +265,40 @@ class IntentProcessor:
         Returns:
             Tuple of (intent_name, confidence_score)
         """
-        text = self.preprocess_text(text)
-        
+        return self._identify_intent_pre(self.preprocess_text(text))
+    
+    def _identify_intent_pre(self, text):
+        """identify_intent for text that has already been preprocessed"""
         if not text:
-            return ('unknown', 0.0)
+            return (INTENT_UNKNOWN, 0.0)
         
-        intent_scores = {}
+        # Check keywords (each distinct keyword counts once)
+        found = set()
+        if self._keyword_automaton is not None:
+            for _, credits in self._keyword_automaton.iter(text):
+                found.update(credits)
+        else:
+            for match in self._keyword_re.finditer(text):
+                found.update(self._keyword_credits[match.group(1)])
+        keyword_scores = Counter(intent_name for _, intent_name in found)
         
+        # Add pattern scores and keep the best intent as we go
+        # (ties go to the intent defined first)
+        best_intent, best_score = None, 0
         for intent_name, intent_data in self.intents.items():
-            score = 0
-            
-            # Check keywords
-            for keyword in intent_data['keywords']:
-                if keyword in text:
-                    score += 1
-            
-            # Check patterns
-            for pattern in intent_data['patterns']:
-                if re.search(pattern, text):
+            score = keyword_scores[intent_name]
+            for pattern in intent_data['compiled_patterns']:
+                if pattern.search(text):
                     score += 2  # Patterns are weighted higher
-            
-            intent_scores[intent_name] = score
-        
-        # Get the intent with highest score
-        best_intent = max(intent_scores, key=intent_scores.get)
-        best_score = intent_scores[best_intent]
+            if score > best_score:
+                best_intent, best_score = intent_name, score
         
-        if best_score > 0:
+        if best_intent is not None:
             # Normalize score to confidence (0-1)
-            max_possible = len(self.intents[best_intent]['keywords']) + \
-                          len(self.intents[best_intent]['patterns']) * 2
-            confidence = min(best_score / max_possible, 1.0)
+            confidence = min(best_score / self.intents[best_intent]['max_possible'], 1.0)
             return (best_intent, confidence)
         
-        return ('unknown', 0.0)
+        return (INTENT_UNKNOWN, 0.0)
     
     def extract_entities(self, text):
         """
@@ -205,7 +310,10 @@ class IntentProcessor:
         Returns:
             Dictionary of extracted entities
         """
-        text = self.preprocess_text(text)
+        return self._extract_entities_pre(self.preprocess_text(text))
+    
+    def _extract_entities_pre(self, text):
+        """extract_entities for text that has already been preprocessed"""
         entities = {
             'department': None,
             'day': None,
@@ -213,25 +321,20 @@ class IntentProcessor:
             'facility': None
         }
         
-        # Extract department
-        for key, value in self.department_mappings.items():
-            if key in text:
-                entities['department'] = value
-                break
-        
-        # Extract day
-        for key, value in self.day_mappings.items():
-            if key in text:
-                entities['day'] = value
-                break
+        # One scan finds every key present; within each category the key that
+        # comes first in its mapping wins
+        best = {}
+        for match in self._entity_re.finditer(text):
+            for category, priority, value in self._entity_credits[match.group(1)]:
+                if category not in best or priority < best[category][0]:
+                    best[category] = (priority, value)
+        for category, (_, value) in best.items():
+            entities[category] = value
         
-        # Extract facility
-        facilities = ['library', 'canteen', 'hostel', 'sports', 'gym', 
-                     'medical', 'hospital', 'bus', 'transport']
-        for facility in facilities:
-            if facility in text:
-                entities['facility'] = facility
-                break
+        if entities['day'] is _TODAY:
+            entities['day'] = self._get_today()
+        elif entities['day'] is _TOMORROW:
+            entities['day'] = self._get_tomorrow()
         
         return entities
     
@@ -245,12 +348,19 @@ class IntentProcessor:
         Returns:
             Dictionary with intent, confidence, and entities
         """
-        intent, confidence = self.identify_intent(text)
-        entities = self.extract_entities(text)
+        result = self._cached_query(text, date.today().toordinal())
+        # Hand out copies so callers can't alter the cached entry
+        return dict(result, entities=dict(result['entities']))
+    
+    def _process_query_uncached(self, text, day_ordinal):
+        """Run the full NLP pipeline for the query cache (day_ordinal only keys the cache)"""
+        processed = self.preprocess_text(text)
+        intent, confidence = self._identify_intent_pre(processed)
+        entities = self._extract_entities_pre(processed)
         
         return {
             'original_text': text,
-            'processed_text': self.preprocess_text(text),
+            'processed_text': processed,
             'intent': intent,
             'confidence': confidence,
             'entities': entities
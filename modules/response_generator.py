@@ -3,13 +3,32 @@ Response Generator Module
 Generates appropriate responses based on intent and data
 """
 
-from modules.data_handler import DataHandler
+import functools
+import itertools
+from datetime import date, timedelta
+
+from modules.nlp_processor import (
+    INTENT_TIMETABLE, INTENT_EXAM, INTENT_DEPARTMENT, INTENT_FACILITY,
+    INTENT_EVENT, INTENT_FAQ, INTENT_GREETING, INTENT_EXIT, INTENT_UNKNOWN
+)
+
+# Intents answered purely from campus data, safe to serve from cache
+CACHEABLE_INTENTS = frozenset({INTENT_TIMETABLE, INTENT_EXAM, INTENT_DEPARTMENT,
+                               INTENT_FACILITY, INTENT_EVENT, INTENT_FAQ})
 
 
 class ResponseGenerator:
     """Generates responses for the campus assistant"""
     
+    # Attributes are fixed after __init__, so skip the per-instance __dict__
+    __slots__ = ('data_handler', 'greetings', 'farewells', 'unknown_responses',
+                 '_greeting_cycle', '_farewell_cycle', '_unknown_cycle',
+                 '_cached_response', '_handlers')
+    
     def __init__(self):
+        # Imported here so importing this module (e.g. for CACHEABLE_INTENTS)
+        # doesn't pull in the data layer
+        from modules.data_handler import DataHandler
         self.data_handler = DataHandler()
         
         # Greeting responses
@@ -33,13 +52,26 @@ class ResponseGenerator:
             "Could you please be more specific? I can help with timetables, exams, department info, and campus facilities."
         ]
         
-        self.response_count = 0
-    
-    def _get_cyclic_response(self, responses):
-        """Get a response cycling through the list"""
-        response = responses[self.response_count % len(responses)]
-        self.response_count += 1
-        return response
+        # Each kind of reply rotates through its own list
+        self._greeting_cycle = itertools.cycle(self.greetings)
+        self._farewell_cycle = itertools.cycle(self.farewells)
+        self._unknown_cycle = itertools.cycle(self.unknown_responses)
+        
+        # Memoized data lookups; today's date is part of the key so day-relative
+        # answers (today's classes, tomorrow's exams) roll over at midnight
+        self._cached_response = functools.lru_cache(maxsize=256)(self._respond_uncached)
+        
+        # Intent -> handler, each called as handler(entities, original_text)
+        self._handlers = {
+            INTENT_GREETING: lambda entities, text: self._handle_greeting(),
+            INTENT_EXIT: lambda entities, text: self._handle_exit(),
+            INTENT_TIMETABLE: self._handle_timetable,
+            INTENT_EXAM: self._handle_exam,
+            INTENT_DEPARTMENT: lambda entities, text: self._handle_department(entities),
+            INTENT_FACILITY: lambda entities, text: self._handle_facility(entities),
+            INTENT_EVENT: lambda entities, text: self._handle_event(),
+            INTENT_FAQ: lambda entities, text: self._handle_faq(text),
+        }
     
     def generate_response(self, query_result):
         """
@@ -51,45 +83,44 @@ class ResponseGenerator:
         Returns:
             Response string
         """
-        intent = query_result.get('intent', 'unknown')
+        intent = query_result.get('intent', INTENT_UNKNOWN)
         entities = query_result.get('entities', {})
-        original_text = query_result.get('original_text', '')
-        
-        # Handle different intents
-        if intent == 'greeting':
-            return self._handle_greeting()
-        
-        elif intent == 'exit':
-            return self._handle_exit()
-        
-        elif intent == 'timetable':
-            return self._handle_timetable(entities, original_text)
-        
-        elif intent == 'exam':
-            return self._handle_exam(entities, original_text)
+        # Lowercased once here; handlers can test it for words directly
+        text = query_result.get('original_text', '').lower().strip()
         
-        elif intent == 'department':
-            return self._handle_department(entities)
+        if intent in CACHEABLE_INTENTS:
+            return self._cached_response(intent, tuple(sorted(entities.items())),
+                                         text, date.today())
         
-        elif intent == 'facility':
-            return self._handle_facility(entities)
-        
-        elif intent == 'event':
-            return self._handle_event()
-        
-        elif intent == 'faq':
-            return self._handle_faq(original_text)
+        return self._dispatch(intent, entities, text)
+    
+    def cache_clear(self):
+        """Forget cached responses (call after the campus data is reloaded)"""
+        self._cached_response.cache_clear()
+    
+    def _respond_uncached(self, intent, entities_items, text, today):
+        """
+        Build a response for the cache
         
-        else:
+        Only intents in CACHEABLE_INTENTS come through here, so the result
+        depends on nothing but the arguments (handlers must stay side-effect-free).
+        """
+        return self._dispatch(intent, dict(entities_items), text)
+    
+    def _dispatch(self, intent, entities, original_text):
+        """Route a query to the handler for its intent"""
+        handler = self._handlers.get(intent)
+        if handler is None:
             return self._handle_unknown(original_text)
+        return handler(entities, original_text)
     
     def _handle_greeting(self):
         """Handle greeting intent"""
-        return self._get_cyclic_response(self.greetings)
+        return next(self._greeting_cycle)
     
     def _handle_exit(self):
         """Handle exit intent"""
-        return self._get_cyclic_response(self.farewells)
+        return next(self._farewell_cycle)
     
     def _handle_timetable(self, entities, original_text):
         """Handle timetable-related queries"""
@@ -97,10 +128,8 @@ class ResponseGenerator:
         department = entities.get('department')
         
         # Check for tomorrow in the query
-        if 'tomorrow' in original_text.lower():
-            from datetime import datetime, timedelta
-            tomorrow = datetime.now() + timedelta(days=1)
-            day = tomorrow.strftime('%A').lower()
+        if 'tomorrow' in original_text:
+            day = (date.today() + timedelta(days=1)).strftime('%A').lower()
         
         return self.data_handler.get_timetable(day=day, department=department)
     
@@ -109,7 +138,7 @@ class ResponseGenerator:
         department = entities.get('department')
         
         # Check for tomorrow's exams
-        if 'tomorrow' in original_text.lower():
+        if 'tomorrow' in original_text:
             return self.data_handler.get_tomorrow_exams(department=department)
         
         return self.data_handler.get_exam_schedule(department=department)
@@ -142,7 +171,7 @@ class ResponseGenerator:
         if faq_answer:
             return faq_answer
         
-        return self._get_cyclic_response(self.unknown_responses)
+        return next(self._unknown_cycle)
     
     def get_help_message(self):
         """Get help message listing available commands"""
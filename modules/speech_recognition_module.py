@@ -7,9 +7,15 @@ Uses sounddevice as alternative to PyAudio for Python 3.14 compatibility
 import speech_recognition as sr
 import numpy as np
 import sounddevice as sd
-import wave
-import tempfile
-import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: Google Cloud Speech streams audio while the user is still talking
+try:
+    from google.cloud import speech as cloud_speech
+except ImportError:
+    cloud_speech = None
 
 
 class SpeechRecognizer:
@@ -19,7 +25,9 @@ class SpeechRecognizer:
         self.recognizer = sr.Recognizer()
         self.sample_rate = sample_rate
         self.channels = 1
+        self.speech_threshold = 500  # mean int16 amplitude treated as speech
         self.microphone_available = False
+        self._cloud_client = None  # Created on first use; False if unavailable
         
         # Test if microphone is available
         try:
@@ -35,13 +43,17 @@ class SpeechRecognizer:
             print(f"⚠️ Audio device error: {e}")
             print("📝 Please use text input mode.")
     
-    def listen(self, timeout=5, phrase_time_limit=10):
+    def listen(self, timeout=5, phrase_time_limit=10, end_silence=0.8):
         """
         Listen to microphone and capture audio using sounddevice
         
+        Recording stops once end_silence seconds of quiet follow speech,
+        so a short question doesn't wait out the whole phrase_time_limit.
+        
         Args:
             timeout: Maximum time to wait for speech to start
             phrase_time_limit: Maximum time for the phrase
+            end_silence: Seconds of silence after speech that end the phrase
             
         Returns:
             AudioData object or None if failed
@@ -51,37 +63,36 @@ class SpeechRecognizer:
             return None
             
         try:
-            print("\n🎤 Listening... Speak now!")
-            
-            # Record audio using sounddevice
-            duration = phrase_time_limit
-            recording = sd.rec(
-                int(duration * self.sample_rate),
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                dtype=np.int16
-            )
-            sd.wait()  # Wait until recording is finished
-            
-            # Save to temporary WAV file
-            temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-            temp_filename = temp_file.name
-            temp_file.close()
-            
-            with wave.open(temp_filename, 'wb') as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(2)  # 16-bit audio
-                wf.setframerate(self.sample_rate)
-                wf.writeframes(recording.tobytes())
+            silence_frames = int(end_silence * self.sample_rate)
+            timeout_frames = int(timeout * self.sample_rate)
+            chunks = []
+            captured = 0
+            silent = 0
+            heard_speech = False
             
-            # Load the audio file for recognition
-            with sr.AudioFile(temp_filename) as source:
-                audio = self.recognizer.record(source)
+            stream = self.stream_chunks(phrase_time_limit=phrase_time_limit)
+            try:
+                for chunk in stream:
+                    chunks.append(chunk)
+                    captured += len(chunk)
+                    if self.is_speech(chunk):
+                        heard_speech, silent = True, 0
+                    elif heard_speech:
+                        silent += len(chunk)
+                        if silent >= silence_frames:
+                            break
+                    elif captured >= timeout_frames:
+                        break
+            finally:
+                stream.close()  # Stops the input stream
             
-            # Clean up temp file
-            os.unlink(temp_filename)
+            if not heard_speech:
+                print("⏱️ No speech detected.")
+                return None
             
-            return audio
+            # Hand the raw 16-bit frames straight to the recognizer
+            return sr.AudioData(b''.join(chunk.tobytes() for chunk in chunks),
+                                self.sample_rate, 2)
             
         except Exception as e:
             print(f"❌ Error capturing audio: {e}")
@@ -139,6 +150,225 @@ class SpeechRecognizer:
             print(f"❌ Sphinx error: {e}")
             return None
     
+    def stream_chunks(self, chunk_duration=0.15, phrase_time_limit=10):
+        """
+        Read microphone audio in short chunks
+        
+        Args:
+            chunk_duration: Length of each audio chunk in seconds
+            phrase_time_limit: Maximum time to capture
+            
+        Yields:
+            int16 NumPy arrays of recorded frames
+        """
+        if not self.microphone_available:
+            print("⚠️ Microphone not available. Please use text input.")
+            return
+        
+        chunks = queue.Queue()
+        
+        def callback(indata, frames, time_info, status):
+            chunks.put(indata.copy())
+        
+        blocksize = int(chunk_duration * self.sample_rate)
+        total_frames = int(phrase_time_limit * self.sample_rate)
+        captured = 0
+        
+        print("\n🎤 Listening... Speak now!")
+        with sd.InputStream(samplerate=self.sample_rate, channels=self.channels,
+                            dtype=np.int16, blocksize=blocksize, callback=callback):
+            while captured < total_frames:
+                chunk = chunks.get()
+                captured += len(chunk)
+                yield chunk
+    
+    def is_speech(self, chunk):
+        """
+        Simple energy-based voice activity check
+        
+        Args:
+            chunk: int16 NumPy array of audio frames
+            
+        Returns:
+            True if the chunk is loud enough to be speech
+        """
+        # Integer sum of magnitudes compared to threshold * length: the same
+        # test as mean() > threshold without the float conversion. The abs is
+        # done in int32 so -32768 doesn't overflow.
+        return np.absolute(chunk, dtype=np.int32).sum(dtype=np.int64) > self.speech_threshold * chunk.size
+    
+    def stream_text(self, language="en-IN", chunk_duration=0.15, partial_interval=1.0,
+                    phrase_time_limit=10, chunks=None, end_silence=0.8, cancel=None,
+                    partial_window=5.0, timeout=5):
+        """
+        Decode speech from audio chunks and yield transcripts as they arrive
+        
+        Every partial_interval seconds of new audio the last partial_window
+        seconds are sent off for an interim hypothesis on a background
+        thread, and it is yielded once it comes back (repeated if unchanged,
+        so callers can tell when it has stabilized). Only one request is in
+        flight at a time; intervals that come up while it is busy are
+        skipped. The final hypothesis covers the whole phrase and is
+        produced once end_silence seconds of quiet follow speech, or when
+        the chunks run out. If nobody speaks within timeout seconds, capture
+        stops and nothing is sent for recognition.
+        
+        Args:
+            language: Language code for recognition
+            chunk_duration: Length of each audio chunk in seconds (0.1-0.2 recommended)
+            partial_interval: Seconds of new audio between interim hypotheses
+            phrase_time_limit: Maximum time for the phrase
+            chunks: Iterable of int16 audio chunks (default: read the microphone)
+            end_silence: Seconds of silence after speech that end the phrase
+            cancel: Optional threading.Event; once set, no transcript is produced
+            partial_window: Seconds of the most recent audio decoded for each interim hypothesis
+            timeout: Maximum time to wait for speech to start
+            
+        Yields:
+            Tuples of (text, is_final). The final text is None if recognition failed.
+        """
+        if chunks is None:
+            if not self.microphone_available:
+                print("⚠️ Microphone not available. Please use text input.")
+                yield (None, True)
+                return
+            chunks = self.stream_chunks(chunk_duration, phrase_time_limit)
+        
+        partial_frames = int(partial_interval * self.sample_rate)
+        silence_frames = int(end_silence * self.sample_rate)
+        timeout_frames = int(timeout * self.sample_rate)
+        window_bytes = int(partial_window * self.sample_rate) * 2
+        buffer = bytearray()
+        captured = 0
+        next_partial = partial_frames
+        heard_speech = False
+        silent = 0
+        # Interim requests run here so a slow round trip never stalls capture
+        partials = ThreadPoolExecutor(max_workers=1)
+        pending = None
+        
+        try:
+            for chunk in chunks:
+                if cancel is not None and cancel.is_set():
+                    break
+                buffer.extend(chunk.tobytes())
+                captured += len(chunk)
+                
+                # Endpoint once the speaker goes quiet after saying something
+                if self.is_speech(chunk):
+                    heard_speech, silent = True, 0
+                elif heard_speech:
+                    silent += len(chunk)
+                    if silent >= silence_frames:
+                        break
+                elif captured >= timeout_frames:
+                    break
+                
+                if pending is not None and pending.done():
+                    try:
+                        partial = pending.result()
+                    except (sr.UnknownValueError, sr.RequestError):
+                        partial = None
+                    pending = None
+                    if partial:
+                        yield (partial, False)
+                
+                if captured >= next_partial:
+                    next_partial += partial_frames
+                    if pending is None and heard_speech:
+                        audio = sr.AudioData(bytes(buffer[-window_bytes:]), self.sample_rate, 2)
+                        pending = partials.submit(self.recognizer.recognize_google,
+                                                  audio, language=language)
+        except Exception as e:
+            print(f"❌ Error capturing audio: {e}")
+            yield (None, True)
+            return
+        finally:
+            # A request still in flight is stale once the phrase has ended
+            partials.shutdown(wait=False)
+        
+        if cancel is not None and cancel.is_set():
+            yield (None, True)
+            return
+        
+        if not heard_speech:
+            print("⏱️ No speech detected.")
+            yield (None, True)
+            return
+        
+        audio = sr.AudioData(bytes(buffer), self.sample_rate, 2)
+        yield (self.recognize_google(audio, language), True)
+    
+    def _get_cloud_client(self):
+        """Create the Cloud Speech client once; None if the library or credentials are missing"""
+        if self._cloud_client is None:
+            self._cloud_client = False
+            if cloud_speech is not None:
+                try:
+                    self._cloud_client = cloud_speech.SpeechClient()
+                except Exception as e:
+                    print(f"⚠️ Google Cloud Speech unavailable, using batch recognition: {e}")
+        return self._cloud_client or None
+    
+    def recognize_streaming(self, language="en-IN", chunk_duration=0.1, phrase_time_limit=10):
+        """
+        Stream microphone audio to Google Cloud Speech while it is recorded
+        
+        Recognition runs alongside the speech, so the transcript is ready
+        almost as soon as the speaker stops instead of after an upload.
+        Requires google-cloud-speech and application default credentials.
+        
+        Args:
+            language: Language code for recognition
+            chunk_duration: Length of each audio chunk in seconds
+            phrase_time_limit: Maximum time for the phrase
+            
+        Returns:
+            Recognized text string or None if failed
+        """
+        client = self._get_cloud_client()
+        if client is None:
+            print("⚠️ Google Cloud Speech is not available.")
+            return None
+        
+        config = cloud_speech.StreamingRecognitionConfig(
+            config=cloud_speech.RecognitionConfig(
+                encoding=cloud_speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                sample_rate_hertz=self.sample_rate,
+                language_code=language,
+            ),
+            single_utterance=True,  # Server ends the stream when speech stops
+        )
+        done = threading.Event()
+        
+        def requests():
+            # Runs on the gRPC sending thread; leaving the loop closes the microphone stream
+            for chunk in self.stream_chunks(chunk_duration, phrase_time_limit):
+                if done.is_set():
+                    break
+                yield cloud_speech.StreamingRecognizeRequest(audio_content=chunk.tobytes())
+        
+        text = None
+        try:
+            for response in client.streaming_recognize(config=config, requests=requests()):
+                for result in response.results:
+                    if result.is_final and result.alternatives:
+                        text = result.alternatives[0].transcript
+                if text:
+                    break
+        except Exception as e:
+            print(f"❌ Streaming recognition error: {e}")
+            return None
+        finally:
+            done.set()
+        
+        if not text:
+            print("❓ Sorry, I couldn't understand that. Please speak clearly.")
+            return None
+        
+        print(f"📝 You said: \"{text}\"")
+        return text
+    
     def get_text_from_speech(self, use_google=True, language="en-IN"):
         """
         Main method to capture and convert speech to text
@@ -150,6 +380,9 @@ class SpeechRecognizer:
         Returns:
             Recognized text string or None if failed
         """
+        if use_google and self._get_cloud_client() is not None:
+            return self.recognize_streaming(language)
+        
         audio = self.listen()
         
         if audio is None:
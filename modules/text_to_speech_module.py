@@ -3,13 +3,190 @@ Text-to-Speech Module
 Handles conversion of text responses to speech output
 """
 
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import hashlib
+import io
+import os
+import queue
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import wave
+
 import pyttsx3
 
+# Playback of pre-synthesized audio needs sounddevice; without it we just synthesize
+try:
+    import numpy as np
+    import sounddevice as sd
+except ImportError:
+    sd = None
+
+# Scratch WAV files go to a RAM-backed directory where there is one
+_TEMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Synthesized utterances are kept here between runs
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get('LOCALAPPDATA') or os.environ.get('XDG_CACHE_HOME')
+    or os.path.join(os.path.expanduser('~'), '.cache'),
+    'campus_tts'
+)
+
+# A sentence runs up to end punctuation followed by whitespace (or the end of
+# the text), so decimals like 3.14 stay whole
+_SENT_RE = re.compile(r'\S.*?(?:[.!?]+(?=\s|$)|$)', re.DOTALL)
+_ABBREVIATIONS = frozenset({'dr', 'mr', 'mrs', 'ms', 'prof', 'am', 'pm'})
+
+
+def split_sentences(text, min_length=10):
+    """
+    Split text into sentences for speech, keeping their punctuation
+    
+    Fragments shorter than min_length, and sentences that end on an
+    abbreviation such as 'Dr.', are joined to the next sentence.
+    
+    Args:
+        text: Text to split
+        min_length: Shortest sentence to yield on its own
+        
+    Yields:
+        Sentence strings
+    """
+    pending = ''
+    for match in _SENT_RE.finditer(text):
+        pending = f"{pending} {match.group()}" if pending else match.group()
+        if _ends_with_abbreviation(pending) or len(pending) < min_length:
+            continue
+        yield pending
+        pending = ''
+    if pending:
+        yield pending
+
+
+# Lightweight record describing one installed voice
+VoiceInfo = collections.namedtuple('VoiceInfo', 'index id name languages gender')
+
+# Engine of a batch_save() worker process
+_worker_engine = None
+
+
+def _init_batch_worker(rate, volume, voice_id):
+    """Start a pyttsx3 engine in a batch_save() worker process"""
+    global _worker_engine
+    _worker_engine = pyttsx3.init()
+    _worker_engine.setProperty('rate', rate)
+    _worker_engine.setProperty('volume', volume)
+    if voice_id is not None:
+        _worker_engine.setProperty('voice', voice_id)
+
+
+def _batch_save_one(job):
+    """Synthesize one (text, path) job in a worker process; returns the path or None"""
+    text, path = job
+    try:
+        _worker_engine.save_to_file(text, path)
+        _worker_engine.runAndWait()
+        return path
+    except Exception as e:
+        print(f"❌ Error saving audio: {e}")
+        return None
+
+
+def _ends_with_abbreviation(text):
+    """Check whether text ends on an abbreviation such as 'Dr.'"""
+    last_word = text.rsplit(None, 1)[-1]
+    return last_word.endswith('.') and last_word.rstrip('.').lower() in _ABBREVIATIONS
+
+
+class SentenceBuffer:
+    """
+    Collect streamed text and hand back whole sentences as soon as they end
+    
+    A sentence is released once its end punctuation is followed by
+    whitespace, using the same rules as split_sentences(). Text that runs
+    on without a boundary is cut at a word break once it reaches
+    first_limit characters (for the first chunk) or next_limit afterwards.
+    """
+    
+    _BOUNDARY_RE = re.compile(r'[.!?]+\s')
+    
+    def __init__(self, min_length=10, first_limit=700, next_limit=4000):
+        self.min_length = min_length
+        self.first_limit = first_limit
+        self.next_limit = next_limit
+        self._buffer = ''
+        self._emitted = False
+    
+    def feed(self, fragment):
+        """
+        Add streamed text
+        
+        Args:
+            fragment: Next piece of text (any length)
+            
+        Returns:
+            List of chunks that are ready to speak
+        """
+        self._buffer += fragment
+        chunks = []
+        start = 0
+        for match in self._BOUNDARY_RE.finditer(self._buffer):
+            sentence = self._buffer[start:match.end()].strip()
+            if len(sentence) < self.min_length or _ends_with_abbreviation(sentence):
+                continue
+            chunks.append(sentence)
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        
+        # No sentence end in sight: cut long runs at the last word break
+        limit = self.next_limit if (self._emitted or chunks) else self.first_limit
+        while len(self._buffer) >= limit:
+            cut = self._buffer.rfind(' ', 0, limit)
+            if cut <= 0:
+                cut = limit
+            chunks.append(self._buffer[:cut].strip())
+            self._buffer = self._buffer[cut:].lstrip()
+            limit = self.next_limit
+        
+        if chunks:
+            self._emitted = True
+        return [chunk for chunk in chunks if chunk]
+    
+    def flush(self):
+        """
+        Release whatever text is left at the end of the stream
+        
+        Returns:
+            List with the remaining chunk, or an empty list
+        """
+        rest = self._buffer.strip()
+        self._buffer = ''
+        return [rest] if rest else []
+
 
 class TextToSpeech:
     """Handles text-to-speech conversion using pyttsx3 (offline)"""
     
-    def __init__(self, rate=150, volume=1.0, voice_index=0):
+    # Starting the speech driver and listing its voices is slow, so every
+    # instance shares one engine (see _ensure_engine)
+    _engine = None
+    _voices = None
+    _voice_ids = None  # Plain lists, so switching voice needs no driver calls
+    _voice_names = None
+    _engine_lock = threading.Lock()
+    
+    # Held while an instance uses the shared engine (see _using_engine), with
+    # the (rate, volume, voice) last applied to it
+    _use_lock = threading.RLock()
+    _applied_settings = None
+    
+    def __init__(self, rate=150, volume=1.0, voice_index=0, cache_dir=DEFAULT_CACHE_DIR,
+                 verbose=True, piper_model=None, max_cache_files=500):
         """
         Initialize the TTS engine
         
@@ -17,22 +194,166 @@ class TextToSpeech:
             rate: Speech rate (words per minute)
             volume: Volume level (0.0 to 1.0)
             voice_index: Index of voice to use (0 = default)
+            cache_dir: Directory for synthesized audio reused across runs (None to disable)
+            max_cache_files: Most clips kept in cache_dir; the least recently
+                used ones are deleted beyond that
+            verbose: If True, print each text as it is spoken
+            piper_model: Path to a piper .onnx voice; if set and the piper
+                program is installed, speak() uses it instead of pyttsx3
         """
-        self.engine = pyttsx3.init()
+        self.verbose = verbose
+        self.engine, self.voices = self._ensure_engine()
         
-        # Set speech rate
-        self.engine.setProperty('rate', rate)
+        # Speech rate, volume and preferred voice, applied to the shared
+        # engine whenever this instance uses it
+        self._rate = rate
+        self._volume = volume
+        self._voice_id = None
+        if voice_index < len(self._voice_ids):
+            self._voice_id = self._voice_ids[voice_index]
+        self._apply_settings()
         
-        # Set volume
-        self.engine.setProperty('volume', volume)
+        # Pre-synthesized WAV data keyed by text and voice settings
+        self._audio_cache = {}
+        self._cache_dir = cache_dir
+        self._max_cache_files = max_cache_files
         
-        # Get available voices and set the preferred one
-        self.voices = self.engine.getProperty('voices')
-        if voice_index < len(self.voices):
-            self.engine.setProperty('voice', self.voices[voice_index].id)
+        # Jobs for the background speech thread (started by speak_async), and
+        # with sounddevice, rendered audio waiting for the playback thread
+        self._speech_q = None
+        self._audio_q = None
+        
+        # Bumped by stop(), so work started before it knows it was cancelled
+        self._stop_generation = 0
+        
+        # Optional piper process that stays loaded between utterances
+        self._piper = None
+        if piper_model:
+            self._start_piper(piper_model)
         
         print("🔊 Text-to-Speech engine initialized!")
     
+    def _start_piper(self, model_path):
+        """
+        Launch piper with a voice model, writing one WAV file per input line
+        
+        Args:
+            model_path: Path to the .onnx voice model
+        """
+        if shutil.which('piper') is None or sd is None:
+            print("⚠️ piper (and sounddevice) not found - using pyttsx3")
+            return
+        try:
+            self._piper = subprocess.Popen(
+                ['piper', '--model', model_path, '--output_dir', tempfile.mkdtemp(dir=_TEMP_DIR)],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, encoding='utf-8', bufsize=1
+            )
+        except OSError as e:
+            print(f"⚠️ Could not start piper: {e}")
+            return
+        print(f"🔊 Using piper voice: {os.path.basename(model_path)}")
+    
+    def _speak_piper(self, text):
+        """
+        Speak text through the piper process, one sentence at a time
+        
+        Each sentence goes to piper as its own line, and piper prints the
+        path of the line's WAV file once it is written, which marks the end
+        of that sentence. The first sentence plays while the next ones are
+        still being synthesized.
+        """
+        generation = self._stop_generation
+        sentences = list(split_sentences(' '.join(text.split())))
+        try:
+            for sentence in sentences:
+                self._piper.stdin.write(sentence + '\n')
+            self._piper.stdin.flush()
+        except OSError as e:
+            print(f"⚠️ piper stopped ({e}) - using pyttsx3")
+            self._piper = None
+            return
+        # Read every path, even after stop(), so the next utterance starts in step
+        for _ in sentences:
+            path = self._piper.stdout.readline().strip()
+            if not path:
+                print("⚠️ piper stopped - using pyttsx3")
+                self._piper = None
+                return
+            try:
+                if generation == self._stop_generation:
+                    with open(path, 'rb') as f:
+                        self._play_wav(f.read())  # stop() cuts this off
+            except OSError as e:
+                print(f"❌ Could not play piper audio: {e}")
+            finally:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+    
+    @classmethod
+    def _ensure_engine(cls):
+        """
+        Start the pyttsx3 engine on first use and reuse it afterwards
+        
+        Returns:
+            Tuple of (engine, available voices)
+        """
+        with cls._engine_lock:
+            if cls._engine is None:
+                engine = pyttsx3.init()
+                cls._voices = engine.getProperty('voices')
+                cls._voice_ids = [voice.id for voice in cls._voices]
+                cls._voice_names = [voice.name for voice in cls._voices]
+                cls._engine = engine
+            return cls._engine, cls._voices
+    
+    @contextlib.contextmanager
+    def _using_engine(self):
+        """
+        Hold the shared engine with this instance's settings applied
+        
+        Other instances wait until the block ends, so their settings can't
+        leak in and two runAndWait() calls never overlap.
+        
+        Yields:
+            The pyttsx3 engine
+        """
+        with self._use_lock:
+            self._apply_settings()
+            yield self.engine
+    
+    def _apply_settings(self):
+        """Set this instance's rate, volume and voice on the shared engine if they differ"""
+        with self._use_lock:
+            settings = (self._rate, self._volume, self._voice_id)
+            if TextToSpeech._applied_settings != settings:
+                self.engine.setProperty('rate', self._rate)
+                self.engine.setProperty('volume', self._volume)
+                if self._voice_id is not None:
+                    self.engine.setProperty('voice', self._voice_id)
+                TextToSpeech._applied_settings = settings
+    
+    def _cache_key(self, text):
+        """Get the audio cache key for a text string in the current voice settings"""
+        key = f"{text}|{self._voice_id}|{self._rate}|{self._volume}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+    
+    def _cache_path(self, key):
+        """Get the disk cache file for a cache key"""
+        return os.path.join(self._cache_dir, key + '.wav')
+    
+    def iter_available_voices(self):
+        """
+        Iterate over available voices without building a list
+        
+        Yields:
+            VoiceInfo tuples of (index, id, name, languages, gender)
+        """
+        for idx, voice in enumerate(self.voices):
+            yield VoiceInfo(idx, voice.id, voice.name, voice.languages, voice.gender)
+    
     def get_available_voices(self):
         """
         Get list of available voices
@@ -40,16 +361,7 @@ class TextToSpeech:
         Returns:
             List of voice objects with id and name
         """
-        voices_info = []
-        for idx, voice in enumerate(self.voices):
-            voices_info.append({
-                'index': idx,
-                'id': voice.id,
-                'name': voice.name,
-                'languages': voice.languages,
-                'gender': voice.gender
-            })
-        return voices_info
+        return [voice._asdict() for voice in self.iter_available_voices()]
     
     def set_voice(self, voice_index):
         """
@@ -58,11 +370,12 @@ class TextToSpeech:
         Args:
             voice_index: Index of the voice to use
         """
-        if 0 <= voice_index < len(self.voices):
-            self.engine.setProperty('voice', self.voices[voice_index].id)
-            print(f"✅ Voice set to: {self.voices[voice_index].name}")
+        if 0 <= voice_index < len(self._voice_ids):
+            self._voice_id = self._voice_ids[voice_index]
+            self._apply_settings()
+            print(f"✅ Voice set to: {self._voice_names[voice_index]}")
         else:
-            print(f"❌ Invalid voice index. Available: 0-{len(self.voices)-1}")
+            print(f"❌ Invalid voice index. Available: 0-{len(self._voice_ids)-1}")
     
     def set_rate(self, rate):
         """
@@ -71,7 +384,8 @@ class TextToSpeech:
         Args:
             rate: Words per minute (100-200 recommended)
         """
-        self.engine.setProperty('rate', rate)
+        self._rate = rate
+        self._apply_settings()
         print(f"✅ Speech rate set to: {rate}")
     
     def set_volume(self, volume):
@@ -82,40 +396,502 @@ class TextToSpeech:
             volume: Volume level (0.0 to 1.0)
         """
         if 0.0 <= volume <= 1.0:
-            self.engine.setProperty('volume', volume)
+            self._volume = volume
+            self._apply_settings()
             print(f"✅ Volume set to: {volume}")
         else:
             print("❌ Volume must be between 0.0 and 1.0")
     
-    def speak(self, text):
+    def precompute(self, texts):
+        """
+        Pre-synthesize frequently spoken phrases into an in-memory cache
+        
+        The audio is also saved to the disk cache, so later runs skip
+        synthesizing phrases that are already there.
+        
+        Args:
+            texts: List of text strings to synthesize
+            
+        Returns:
+            Dictionary mapping text digests to WAV bytes
+        """
+        for text in texts:
+            if not text or not text.strip() or self._cache_key(text) in self._audio_cache:
+                continue
+            data = self._render(text, persist=True)
+            if data is not None:
+                self._audio_cache[self._cache_key(text)] = data
+        return self._audio_cache
+    
+    def _cached_audio(self, text):
+        """
+        Look up audio for a text string in memory, then on disk
+        
+        Returns:
+            WAV bytes, or None if the text hasn't been synthesized
+        """
+        key = self._cache_key(text)
+        data = self._audio_cache.get(key)
+        if data is None and self._cache_dir is not None:
+            path = self._cache_path(key)
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                os.utime(path)  # Mark as recently used for _prune_cache()
+            except OSError:
+                pass
+        return data
+    
+    def _render(self, text, persist=False):
+        """
+        Get WAV bytes for a text string, synthesizing them if needed
+        
+        Args:
+            text: Text string to render
+            persist: If True, save newly synthesized audio to the disk cache
+            
+        Returns:
+            WAV bytes, or None if synthesis failed or was cut off by stop()
+        """
+        data = self._cached_audio(text)
+        if data is not None:
+            return data
+        generation = self._stop_generation
+        data = self._synthesize(text)
+        if generation != self._stop_generation:
+            return None  # The engine was stopped part way, so the audio may be cut short
+        if data is not None and persist:
+            self._save_cached(text, data)
+        return data
+    
+    def _save_cached(self, text, data):
+        """Write WAV bytes for a text string to the disk cache (if enabled)"""
+        if self._cache_dir is None:
+            return
+        path = self._cache_path(self._cache_key(text))
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            # Write then rename, so a half-written file is never played
+            with open(path + '.tmp', 'wb') as f:
+                f.write(data)
+            os.replace(path + '.tmp', path)
+        except OSError as e:
+            print(f"⚠️ Could not cache speech audio: {e}")
+        else:
+            self._prune_cache()
+    
+    def start_render(self, text):
+        """
+        Queue text to be synthesized for the cache on a running engine loop
+        
+        For callers that drive the engine with startLoop(False) and
+        iterate(), where precompute() can't run. Once the engine is no
+        longer busy, pass the result to finish_render().
+        
+        Args:
+            text: Text string to synthesize
+            
+        Returns:
+            Render job for finish_render()
+        """
+        fd, path = tempfile.mkstemp(suffix='.wav', dir=_TEMP_DIR)
+        os.close(fd)
+        with self._using_engine() as engine:
+            engine.save_to_file(text, path)
+        return (text, path, self._stop_generation)
+    
+    def finish_render(self, job):
+        """
+        Cache the audio of a render started with start_render()
+        
+        Renders cut off by stop() are discarded.
+        
+        Args:
+            job: Value returned by start_render()
+        """
+        text, path, generation = job
+        try:
+            if generation != self._stop_generation:
+                return
+            with open(path, 'rb') as f:
+                data = self._trim_silence(f.read())
+            self._audio_cache[self._cache_key(text)] = data
+            self._save_cached(text, data)
+        except Exception as e:
+            print(f"⚠️ Could not synthesize speech: {e}")
+        finally:
+            os.unlink(path)
+    
+    def _prune_cache(self):
+        """Delete the least recently used clips once the disk cache is over its limit"""
+        try:
+            entries = [entry for entry in os.scandir(self._cache_dir)
+                       if entry.name.endswith('.wav')]
+            excess = len(entries) - self._max_cache_files
+            if excess <= 0:
+                return
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in entries[:excess]:
+                os.unlink(entry.path)
+        except OSError as e:
+            print(f"⚠️ Could not prune speech cache: {e}")
+    
+    def _synthesize(self, text):
+        """
+        Render text to WAV bytes without playing it
+        
+        Args:
+            text: Text string to synthesize
+            
+        Returns:
+            WAV file contents, or None if synthesis failed
+        """
+        fd, path = tempfile.mkstemp(suffix='.wav', dir=_TEMP_DIR)
+        os.close(fd)
+        try:
+            with self._using_engine() as engine:
+                engine.save_to_file(text, path)
+                engine.runAndWait()
+            with open(path, 'rb') as f:
+                return self._trim_silence(f.read())
+        except Exception as e:
+            print(f"⚠️ Could not synthesize speech: {e}")
+            return None
+        finally:
+            os.unlink(path)
+    
+    @staticmethod
+    def _trim_silence(data, threshold=200, padding=0.02):
+        """
+        Cut the leading and trailing silence some drivers write around speech
+        
+        Args:
+            data: WAV file contents
+            threshold: Sample magnitude below which audio counts as silence
+            padding: Seconds of audio kept either side of the speech
+            
+        Returns:
+            WAV bytes without the silent ends (unchanged if they can't be trimmed)
+        """
+        if sd is None:
+            return data  # Needs NumPy, which only comes with playback support
+        with wave.open(io.BytesIO(data), 'rb') as wf:
+            params = wf.getparams()
+            frames = wf.readframes(wf.getnframes())
+        if params.sampwidth != 2:
+            return data
+        
+        samples = np.frombuffer(frames, dtype=np.int16)
+        loud = np.flatnonzero(np.absolute(samples, dtype=np.int32) > threshold)
+        if len(loud) == 0:
+            return data
+        pad = int(padding * params.framerate)
+        first = max(loud[0] // params.nchannels - pad, 0)
+        last = min(loud[-1] // params.nchannels + 1 + pad, len(samples) // params.nchannels)
+        
+        out = io.BytesIO()
+        with wave.open(out, 'wb') as wf:
+            wf.setparams(params)
+            wf.writeframes(samples[first * params.nchannels:last * params.nchannels].tobytes())
+        return out.getvalue()
+    
+    def is_cached(self, text):
+        """Check whether a text string has pre-synthesized audio (in memory or on disk)"""
+        key = self._cache_key(text)
+        if key in self._audio_cache:
+            return True
+        return self._cache_dir is not None and os.path.exists(self._cache_path(key))
+    
+    def _play_cached(self, text):
+        """
+        Play pre-synthesized audio for a text string
+        
+        Args:
+            text: Text string to play
+            
+        Returns:
+            True if the text was cached and played, False otherwise
+        """
+        data = self._cached_audio(text)
+        if data is None:
+            return False
+        return self._play_wav(data)
+    
+    @property
+    def playback_available(self):
+        """Whether pre-synthesized audio can be played (needs sounddevice)"""
+        return sd is not None
+    
+    def play_cached_nowait(self, text):
+        """
+        Start playing pre-synthesized audio for a text string and return at once
+        
+        The clip plays in the background until it ends or stop() is called.
+        
+        Args:
+            text: Text string to play
+            
+        Returns:
+            Length of the clip in seconds, or None if it wasn't cached or can't be played
+        """
+        data = self._cached_audio(text)
+        if data is None:
+            return None
+        return self._start_wav(data)
+    
+    def _start_wav(self, data, pause=0.0):
+        """
+        Start playing WAV bytes through sounddevice without waiting
+        
+        Args:
+            data: WAV file contents
+            pause: Seconds of silence to play after the audio
+            
+        Returns:
+            Length of the audio in seconds, or None if it can't be played
+        """
+        if sd is None:
+            return None
+        try:
+            with wave.open(io.BytesIO(data), 'rb') as wf:
+                if wf.getsampwidth() != 2:
+                    return None
+                channels = wf.getnchannels()
+                samples = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+                samples = samples.reshape(-1, channels)
+                if pause > 0:
+                    silence = np.zeros((int(pause * wf.getframerate()), channels), dtype=np.int16)
+                    samples = np.concatenate([samples, silence])
+                sd.play(samples, wf.getframerate())
+                return len(samples) / wf.getframerate()
+        except Exception:
+            return None
+    
+    def _play_wav(self, data, pause=0.0):
+        """
+        Play WAV bytes through sounddevice and wait for them to finish
+        
+        Args:
+            data: WAV file contents
+            pause: Seconds of silence to play after the audio
+            
+        Returns:
+            True if the audio was played, False otherwise
+        """
+        if self._start_wav(data, pause) is None:
+            return False
+        try:
+            sd.wait()
+            return True
+        except Exception:
+            return False
+    
+    def _announce(self, text):
+        """Print the start of a text being spoken (if verbose)"""
+        if self.verbose:
+            preview = text if len(text) <= 50 else text[:50] + "..."
+            print(f"🔊 Speaking: \"{preview}\"")
+    
+    def speak(self, text, cache=False):
         """
         Convert text to speech and play it
         
         Args:
             text: Text string to speak
+            cache: If True, synthesize the text into the disk cache (when
+                playback is available) so it plays from the file next time;
+                otherwise uncached text is spoken directly by the engine
         """
-        if text:
-            print(f"🔊 Speaking: \"{text[:50]}...\"" if len(text) > 50 else f"🔊 Speaking: \"{text}\"")
-            self.engine.say(text)
-            self.engine.runAndWait()
+        if text and text.strip():
+            self._announce(text)
+            if self._piper is not None:
+                self._speak_piper(text)
+                return
+            if self._play_cached(text):
+                return
+            if cache and sd is not None and self._cache_dir is not None:
+                data = self._render(text, persist=True)
+                if data is not None and self._play_wav(data):
+                    return
+            with self._using_engine() as engine:
+                engine.say(text)
+                engine.runAndWait()
         else:
             print("⚠️ No text to speak")
     
+    def speak_async(self, text):
+        """
+        Queue text to be spoken on a background thread and return at once
+        
+        Queued texts are spoken in order; call wait() to block until done.
+        Don't call speak() from another thread while the queue is busy.
+        
+        Args:
+            text: Text string to speak
+        """
+        if sd is None or self._piper is not None:
+            self._submit(self.speak, text)
+            return
+        if self._audio_q is None:
+            # Two clips deep: the next text renders while the current one plays
+            self._audio_q = queue.Queue(maxsize=2)
+            threading.Thread(target=self._playback_worker, daemon=True).start()
+        self._submit(self._render_for_playback, text)
+    
+    def _render_for_playback(self, text):
+        """Render queued text to audio and hand it to the playback thread"""
+        if not text or not text.strip():
+            return
+        generation = self._stop_generation
+        data = self._render(text)
+        if generation != self._stop_generation:
+            return  # stop() ran while this was rendering
+        if data is None:
+            # Synthesis failed: let earlier clips finish, then speak directly
+            self._audio_q.join()
+            if generation != self._stop_generation:
+                return
+            with self._using_engine() as engine:
+                engine.say(text)
+                engine.runAndWait()
+            return
+        self._audio_q.put((text, data))
+    
+    def _playback_worker(self):
+        """Play rendered clips in the order they were queued"""
+        while True:
+            text, data = self._audio_q.get()
+            try:
+                self._announce(text)
+                self._play_wav(data)
+            finally:
+                self._audio_q.task_done()
+    
+    def speak_stream(self, fragments):
+        """
+        Speak streamed text (e.g. a reply arriving token by token) as it comes in
+        
+        Each sentence is queued with speak_async() as soon as it is
+        complete, so speech starts before the stream ends. Returns when the
+        stream is exhausted; call wait() to block until it has been spoken.
+        
+        Args:
+            fragments: Iterable of text pieces
+        """
+        buffer = SentenceBuffer()
+        for fragment in fragments:
+            for chunk in buffer.feed(fragment):
+                self.speak_async(chunk)
+        for chunk in buffer.flush():
+            self.speak_async(chunk)
+    
+    def preload_phrases(self, phrases):
+        """
+        Synthesize canned phrases in the background so they later play from cache
+        
+        The work is queued on the speak_async() thread, so it never uses
+        the engine at the same time as queued speech.
+        
+        Args:
+            phrases: List of text strings likely to be spoken
+        """
+        self._submit(self.precompute, list(phrases))
+    
+    def _submit(self, func, arg):
+        """Queue func(arg) for the background speech thread, starting it if needed"""
+        if self._speech_q is None:
+            self._speech_q = queue.Queue()
+            threading.Thread(target=self._speech_worker, daemon=True).start()
+        self._speech_q.put((func, arg))
+    
+    def _speech_worker(self):
+        """Run queued speech and preload jobs one after another"""
+        while True:
+            func, arg = self._speech_q.get()
+            try:
+                func(arg)
+            except Exception as e:
+                print(f"❌ Speech error: {e}")
+            finally:
+                self._speech_q.task_done()
+    
+    def wait(self):
+        """Block until everything queued with speak_async() has been spoken"""
+        if self._speech_q is not None:
+            self._speech_q.join()
+        if self._audio_q is not None:
+            self._audio_q.join()
+    
+    def stop(self):
+        """Stop the current utterance and discard any queued speech"""
+        self._stop_generation += 1
+        kept = []  # Preload and save jobs still run; only speech is dropped
+        for pending in (self._speech_q, self._audio_q):
+            if pending is None:
+                continue
+            while True:
+                try:
+                    job = pending.get_nowait()
+                except queue.Empty:
+                    break
+                pending.task_done()
+                if pending is self._speech_q and job[0] not in (self.speak, self._render_for_playback):
+                    kept.append(job)
+        for job in kept:
+            self._speech_q.put(job)
+        self.engine.stop()
+        if sd is not None:
+            sd.stop()
+    
     def speak_with_pause(self, text, pause_duration=0.5):
         """
         Speak text with a pause after sentences
         
+        Blocks until the text has been spoken. Don't call it from a job on
+        the speak_async() thread, which it uses for synthesis.
+        
         Args:
             text: Text string to speak
-            pause_duration: Duration of pause in seconds (approximate)
+            pause_duration: Seconds of silence between sentences (exact when
+                sounddevice is available, otherwise left to the driver)
         """
-        if text:
-            sentences = text.replace('!', '.').replace('?', '.').split('.')
-            for sentence in sentences:
-                sentence = sentence.strip()
-                if sentence:
-                    self.engine.say(sentence)
-                    self.engine.runAndWait()
+        if not text or not text.strip():
+            return
+        if self._piper is not None:
+            self.speak(text)  # piper already streams sentence by sentence
+            return
+        sentences = list(split_sentences(text))
+        
+        if sd is None:
+            # Queue every sentence and run the driver loop once for all of them
+            with self._using_engine() as engine:
+                for sentence in sentences:
+                    engine.say(sentence)
+                engine.runAndWait()
+            return
+        
+        # Synthesize the next sentence while the current one plays. Synthesis
+        # runs on the speech thread, so it takes turns with other engine work;
+        # playback goes through sounddevice.
+        audio_q = queue.Queue(maxsize=2)
+        done = object()
+        generation = self._stop_generation
+        
+        def synthesize(_):
+            try:
+                for index, sentence in enumerate(sentences):
+                    if generation != self._stop_generation:
+                        break
+                    audio_q.put((index, self._render(sentence)))
+            finally:
+                audio_q.put(done)
+        
+        self._submit(synthesize, None)
+        last = len(sentences) - 1
+        # Keep draining after stop() so the speech thread never blocks on a full queue
+        for index, data in iter(audio_q.get, done):
+            if data is not None and generation == self._stop_generation:
+                self._play_wav(data, pause=pause_duration if index < last else 0.0)
     
     def save_to_file(self, text, filename):
         """
@@ -125,12 +901,66 @@ class TextToSpeech:
             text: Text string to convert
             filename: Output filename (mp3/wav)
         """
+        if not text or not text.strip():
+            print("⚠️ No text to save")
+            return
         try:
-            self.engine.save_to_file(text, filename)
-            self.engine.runAndWait()
+            with self._using_engine() as engine:
+                engine.save_to_file(text, filename)
+                engine.runAndWait()
             print(f"✅ Audio saved to: {filename}")
         except Exception as e:
             print(f"❌ Error saving audio: {e}")
+    
+    def batch_save(self, texts, directory, max_workers=None):
+        """
+        Save many texts to WAV files in parallel, one engine per worker process
+        
+        Files are named by the same key as the audio cache, so the same text
+        in the same voice settings always maps to the same file.
+        
+        Args:
+            texts: List of text strings to convert
+            directory: Output directory (created if needed)
+            max_workers: Number of worker processes (default: CPU count)
+            
+        Returns:
+            List of file paths in the order of texts (None where saving failed)
+        """
+        os.makedirs(directory, exist_ok=True)
+        jobs = [(text, os.path.join(directory, self._cache_key(text) + '.wav'))
+                for text in texts if text and text.strip()]
+        if not jobs:
+            return [None] * len(texts)
+        
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers or os.cpu_count(),
+                initializer=_init_batch_worker,
+                initargs=(self._rate, self._volume, self._voice_id)) as pool:
+            saved = iter(pool.map(_batch_save_one, jobs))
+        return [next(saved) if text and text.strip() else None for text in texts]
+    
+    async def save_to_file_async(self, text, filename):
+        """
+        Save speech to an audio file without blocking the event loop
+        
+        The save runs on the speak_async() thread, so it never uses the
+        engine at the same time as queued speech or other saves.
+        
+        Args:
+            text: Text string to convert
+            filename: Output filename (mp3/wav)
+        """
+        done = concurrent.futures.Future()
+        
+        def save(args):
+            try:
+                done.set_result(self.save_to_file(*args))
+            except Exception as e:
+                done.set_exception(e)
+        
+        self._submit(save, (text, filename))
+        await asyncio.wrap_future(done)
 
 
 # Test the module
@@ -143,8 +973,8 @@ if __name__ == "__main__":
     
     # Show available voices
     print("\n📋 Available voices:")
-    for voice in tts.get_available_voices():
-        print(f"  [{voice['index']}] {voice['name']}")
+    for voice in tts.iter_available_voices():
+        print(f"  [{voice.index}] {voice.name}")
     
     # Test speech
     print("\n🎤 Testing speech output...")